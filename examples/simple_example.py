@@ -1,4 +1,3 @@
-import asyncio
 import os
 import sys
 
@@ -8,6 +7,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from uranus.agent.reactive_agent import ReactiveAgent
 from uranus.tool.system_tool import SystemInfoTool
 from uranus.tool.file_operations import FileOperationsTool
+from uranus.utils.async_utils import run
 
 
 async def main():
@@ -24,10 +24,13 @@ async def main():
     agent.tools.register(SystemInfoTool())
     agent.tools.register(FileOperationsTool())
     
+    # Prime the LLM connection while the first request is being prepared
+    await agent.warmup()
+    
     # Run the agent with a query
     result = await agent.run("Can you tell me about the current system status?")
     print(result)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run(main())
\ No newline at end of file
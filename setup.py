@@ -7,6 +7,7 @@ setup(
     install_requires=[
         "pydantic>=2.0.0",
         "openai>=1.0.0",
+        "httpx>=0.27",
         "psutil>=5.9.0",
         "aiohttp>=3.8.0",
         "browser_use>=0.1.40",
@@ -0,0 +1,19 @@
+"""Shared fixtures for the Uranus test suite."""
+from types import MappingProxyType
+from typing import Mapping
+
+import pytest
+
+from tests.mocks.mock_llm import DEFAULT_RESPONSES, MockLLM
+
+
+@pytest.fixture(scope="session")
+def mock_responses() -> Mapping[str, str]:
+    """Read-only view of the default mock responses, built once per session."""
+    return MappingProxyType(DEFAULT_RESPONSES)
+
+
+@pytest.fixture
+def mock_llm(mock_responses) -> MockLLM:
+    """A MockLLM backed by its own copy of the shared responses."""
+    return MockLLM(responses=dict(mock_responses))
\ No newline at end of file
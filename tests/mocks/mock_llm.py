@@ -1,30 +1,45 @@
 """Mock LLM implementation for testing."""
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Mapping
 
 from uranus.core.llm import LLM, LLMResponse
+from uranus.schema.memory import Memory
 from uranus.schema.message import Message
 
 
+# Canned responses shared by every MockLLM instance
+DEFAULT_RESPONSES: Dict[str, str] = {
+    "Say 'Test successful'": "Test successful",
+    "What's the current system status?": "System Information:\n\nCPU: Mock CPU\nMEMORY: Mock Memory\nDISK: Mock Disk\nPLATFORM: Mock Platform",
+    "Create a file called test_notes.txt with the content 'This is a test note'": "I've created the file test_notes.txt with the content 'This is a test note'.",
+    "Read the content of test_notes.txt": "The content of test_notes.txt is: This is a test note",
+    "Delete the test_notes.txt file": "I've deleted the file test_notes.txt."
+}
+
+
 class MockLLM:
     """Mock LLM for testing purposes."""
     
-    def __init__(self, config_name: str = "default"):
-        """Initialize the mock LLM."""
+    def __init__(
+        self,
+        config_name: str = "default",
+        responses: Optional[Mapping[str, str]] = None
+    ):
+        """Initialize the mock LLM.
+        
+        Args:
+            config_name: Ignored, kept for signature compatibility with LLM.
+            responses: Optional response mapping to use instead of a copy of DEFAULT_RESPONSES.
+        """
         # Skip the parent class initialization
         self.initialized = True
-        self.responses = {
-            "Say 'Test successful'": "Test successful",
-            "What's the current system status?": "System Information:\n\nCPU: Mock CPU\nMEMORY: Mock Memory\nDISK: Mock Disk\nPLATFORM: Mock Platform",
-            "Create a file called test_notes.txt with the content 'This is a test note'": "I've created the file test_notes.txt with the content 'This is a test note'.",
-            "Read the content of test_notes.txt": "The content of test_notes.txt is: This is a test note",
-            "Delete the test_notes.txt file": "I've deleted the file test_notes.txt."
-        }
+        self.responses = responses if responses is not None else dict(DEFAULT_RESPONSES)
     
     async def ask(
         self, 
         messages: List[Message], 
         system_prompt: Optional[str] = None,
-        temperature: Optional[float] = None
+        temperature: Optional[float] = None,
+        memory: Optional[Memory] = None
     ) -> str:
         """
         Return a predefined response based on the last user message.
@@ -33,17 +48,23 @@ class MockLLM:
             messages: List of messages to send to the LLM.
             system_prompt: Optional system prompt to prepend.
             temperature: Optional temperature override.
+            memory: Optional memory the messages came from; its tracked
+                last user message is used instead of scanning messages.
             
         Returns:
             str: The predefined response.
         """
-        # Get the last user message
-        user_messages = [m for m in messages if m.role == "user"]
-        if not user_messages:
+        # Get the last user message without materializing the whole history
+        if memory is not None:
+            last_user_message = memory.last_user_content
+        else:
+            last_user_message = next(
+                (m.content for m in reversed(messages) if m.role == "user"),
+                None
+            )
+        if last_user_message is None:
             return "No user message found."
         
-        last_user_message = user_messages[-1].content
-        
         # Return a predefined response or a default one
         return self.responses.get(
             last_user_message, 
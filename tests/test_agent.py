@@ -8,11 +8,10 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from uranus.agent.reactive_agent import ReactiveAgent
 from uranus.tool.system_tool import SystemInfoTool
-from tests.mocks.mock_llm import MockLLM
 
 
 @pytest.mark.asyncio
-async def test_reactive_agent():
+async def test_reactive_agent(mock_llm):
     """Test the reactive agent."""
     # Create a reactive agent
     agent = ReactiveAgent(
@@ -23,7 +22,7 @@ async def test_reactive_agent():
     )
     
     # Replace the LLM with our mock
-    agent.llm = MockLLM()
+    agent.llm = mock_llm
     
     # Register a tool
     agent.tools.register(SystemInfoTool())
@@ -32,4 +31,64 @@ async def test_reactive_agent():
     result = await agent.run("Say 'Test successful'")
     
     # Check that the agent responded correctly
-    assert "Test successful" in result
\ No newline at end of file
+    assert "Test successful" in result
+
+
+@pytest.mark.asyncio
+async def test_run_batch_async(mock_llm):
+    """Test running several prompts through isolated agent copies."""
+    agent = ReactiveAgent(
+        name="TestAgent",
+        description="A test agent",
+        system_prompt="You are a test agent."
+    )
+    agent.llm = mock_llm
+    
+    prompts = ["Say 'Test successful'", "first prompt", "second prompt"]
+    results = await agent.run_batch_async(prompts, max_concurrency=2)
+    
+    assert results == [
+        "Test successful",
+        "Mock response to: first prompt",
+        "Mock response to: second prompt",
+    ]
+    
+    # The original agent's memory is untouched
+    assert not agent.memory.messages
+
+
+@pytest.mark.asyncio
+async def test_run_stream(mock_llm):
+    """Test that a streamed run yields the same response and records it in memory."""
+    agent = ReactiveAgent(
+        name="TestAgent",
+        description="A test agent",
+        system_prompt="You are a test agent."
+    )
+    agent.llm = mock_llm
+    
+    chunks = [chunk async for chunk in agent.run_stream("Say 'Test successful'")]
+    
+    assert "".join(chunks) == "Test successful"
+    assert agent.memory.get_last_assistant_message().content == "Test successful"
+    assert agent.state == "IDLE"
+
+
+@pytest.mark.asyncio
+async def test_shortcut_dispatch(mock_llm):
+    """Test that shortcuts honour subclass overrides and fall through unavailable tools."""
+    class EchoAgent(ReactiveAgent):
+        async def _handle_terminal(self, input_text, low):
+            return self._respond(f"Handled: {input_text}")
+    
+    agent = EchoAgent(
+        name="TestAgent",
+        description="A test agent",
+        system_prompt="You are a test agent."
+    )
+    agent.llm = mock_llm
+    
+    assert await agent.run("pwd") == "Handled: pwd"
+    
+    # No system_info tool is registered, so the terminal shortcut still applies
+    assert await agent.run("echo system info") == "Handled: echo system info"
\ No newline at end of file
@@ -2,7 +2,7 @@ import pytest
 import os
 import tempfile
 from pathlib import Path
-from uranus.core.config import Config
+from uranus.core.config import Config, get_config
 
 
 def test_config_singleton():
@@ -11,6 +11,7 @@ def test_config_singleton():
     config2 = Config()
     
     assert config1 is config2
+    assert get_config() is config1
 
 
 def test_config_llm():
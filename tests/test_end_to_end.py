@@ -1,17 +1,13 @@
 import pytest
 import asyncio
-import os
 from pathlib import Path
 from uranus.agent.reactive_agent import ReactiveAgent
 from uranus.tool.system_tool import SystemInfoTool
 from uranus.tool.file_operations import FileOperationsTool
 
-# Fix the import path - use a relative import instead of an absolute one
-from .mocks.mock_llm import MockLLM
-
 
 @pytest.mark.asyncio
-async def test_full_conversation():
+async def test_full_conversation(mock_llm):
     """Test a full conversation with the agent."""
     # Create a reactive agent
     agent = ReactiveAgent(
@@ -22,7 +18,7 @@ async def test_full_conversation():
     )
     
     # Replace the LLM with our mock
-    agent.llm = MockLLM()
+    agent.llm = mock_llm
     
     # Register tools
     agent.tools.register(SystemInfoTool())
@@ -30,7 +26,7 @@ async def test_full_conversation():
     
     # Create a test workspace
     test_dir = Path.home() / "uranus_workspace" / "test_conversation"
-    os.makedirs(test_dir, exist_ok=True)
+    test_dir.mkdir(parents=True, exist_ok=True)
     
     # Run a series of commands
     responses = []
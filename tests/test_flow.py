@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from uranus.agent.reactive_agent import ReactiveAgent
+from uranus.flow.sequential_flow import SequentialFlow
+
+
+def make_agent(name, mock_llm):
+    """Create a reactive agent backed by the mock LLM."""
+    agent = ReactiveAgent(
+        name=name,
+        description="A test agent",
+        system_prompt="You are a test agent."
+    )
+    agent.llm = mock_llm
+    return agent
+
+
+@pytest.mark.asyncio
+async def test_sequential_flow(mock_llm):
+    """Test that each agent receives the previous agent's result."""
+    flow = SequentialFlow([make_agent("first", mock_llm), make_agent("second", mock_llm)])
+    
+    result = await flow.execute("hello")
+    
+    assert result == "Mock response to: hello\n\nMock response to: Mock response to: hello"
+
+
+@pytest.mark.asyncio
+async def test_parallel_flow(mock_llm):
+    """Test that parallel agents all receive the original input."""
+    flow = SequentialFlow(
+        [make_agent("first", mock_llm), make_agent("second", mock_llm)],
+        agent_sequence=["second", "missing", "first"],
+        parallel=True
+    )
+    
+    result = await flow.execute("hello")
+    
+    assert result == "Mock response to: hello\n\nMock response to: hello"
+
+
+@pytest.mark.asyncio
+async def test_parallel_flow_repeated_agent(mock_llm):
+    """Test that an agent listed twice runs its repeat on an isolated copy."""
+    agent = make_agent("first", mock_llm)
+    flow = SequentialFlow([agent], agent_sequence=["first", "first"], parallel=True)
+    
+    result = await flow.execute("hello")
+    
+    assert result == "Mock response to: hello\n\nMock response to: hello"
+    assert [message.content for message in agent.memory.messages] == ["hello", "Mock response to: hello"]
+
+
+@pytest.mark.asyncio
+async def test_parallel_flow_propagates_cancellation(mock_llm):
+    """Test that a cancelled agent cancels the flow rather than becoming an error result."""
+    class CancelledAgent(ReactiveAgent):
+        async def run(self, input_text):
+            raise asyncio.CancelledError()
+    
+    cancelled = CancelledAgent(name="cancelled", description="A test agent", system_prompt="")
+    flow = SequentialFlow([make_agent("first", mock_llm), cancelled], parallel=True)
+    
+    with pytest.raises(asyncio.CancelledError):
+        await flow.execute("hello")
\ No newline at end of file
@@ -0,0 +1,234 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from collections import OrderedDict
+from types import SimpleNamespace
+from openai import AsyncOpenAI
+
+from uranus.core.llm import LLM, get_llm, get_http_client, _accepts_raw_body
+from uranus.schema.message import Message, MessageRole
+
+
+class FakeCompletions:
+    """Stand-in for client.chat.completions that counts requests."""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    async def create(self, **kwargs):
+        self.calls += 1
+        message = SimpleNamespace(content=f"Response {self.calls}")
+        if kwargs.get("stream"):
+            return self._stream(message.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+    
+    async def _stream(self, content):
+        for word in content.split(" "):
+            delta = SimpleNamespace(content=word + " ")
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+class FakeClient:
+    """Stand-in for AsyncOpenAI exposing both request paths used by LLM."""
+    
+    def __init__(self):
+        self.completions = FakeCompletions()
+        self.chat = SimpleNamespace(completions=self.completions)
+    
+    async def post(self, path, *, content, cast_to, options=None, stream=False, stream_cls=None):
+        assert path == "/chat/completions"
+        return await self.completions.create(**json.loads(content))
+
+
+class OldSignatureClient(AsyncOpenAI):
+    """AsyncOpenAI as shipped by openai releases whose post() has no content parameter."""
+    
+    async def post(self, path, *, cast_to, body=None, options={}, files=None, stream=False, stream_cls=None):
+        return await super().post(
+            path, cast_to=cast_to, body=body, options=options, files=files, stream=stream, stream_cls=stream_cls
+        )
+
+
+def _completion_transport(requests):
+    """Mock transport answering chat completion requests like the OpenAI API."""
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v1/chat/completions"
+        body = json.loads(request.content)
+        requests.append(body)
+        if body.get("stream"):
+            events = "".join(
+                "data: " + json.dumps({
+                    "id": "c1", "object": "chat.completion.chunk", "created": 0, "model": body["model"],
+                    "choices": [{"index": 0, "delta": {"content": word}, "finish_reason": None}]
+                }) + "\n\n"
+                for word in ("Hi ", "there")
+            )
+            return httpx.Response(
+                200,
+                headers={"content-type": "text/event-stream"},
+                content=(events + "data: [DONE]\n\n").encode()
+            )
+        return httpx.Response(200, json={
+            "id": "c1", "object": "chat.completion", "created": 0, "model": body["model"],
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": "Hi there"},
+                "finish_reason": "stop"
+            }]
+        })
+    
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("client_class", [AsyncOpenAI, OldSignatureClient])
+@pytest.mark.parametrize("use_orjson", [True, False])
+async def test_llm_with_sdk_client(monkeypatch, client_class, use_orjson):
+    """Test both request paths against the real SDK client over a mocked transport."""
+    requests = []
+    llm = LLM()
+    monkeypatch.setattr(llm, "client", client_class(
+        api_key="test-key",
+        base_url="http://llm.test/v1",
+        http_client=httpx.AsyncClient(transport=_completion_transport(requests))
+    ))
+    monkeypatch.setattr(llm, "initialized", True)
+    monkeypatch.setattr(llm, "cache_enabled", False)
+    if not use_orjson:
+        monkeypatch.setattr("uranus.core.llm.orjson", None)
+    
+    messages = [Message(role=MessageRole.USER, content="Hello")]
+    
+    assert await llm.ask(messages, system_prompt="Be brief.") == "Hi there"
+    assert [chunk async for chunk in llm.ask_stream(messages)] == ["Hi ", "there"]
+    assert requests[0]["messages"] == [
+        {"role": "system", "content": "Be brief."},
+        {"role": "user", "content": "Hello"}
+    ]
+    assert requests[1]["stream"] is True
+    assert _accepts_raw_body(client_class) is (client_class is AsyncOpenAI)
+
+
+@pytest.mark.asyncio
+async def test_llm_response_cache(monkeypatch):
+    """Test that identical requests are answered from the response cache."""
+    llm = LLM()
+    client = FakeClient()
+    completions = client.completions
+    monkeypatch.setattr(llm, "client", client)
+    monkeypatch.setattr(llm, "initialized", True)
+    monkeypatch.setattr(llm, "cache_enabled", True)
+    monkeypatch.setattr(llm, "_response_cache", OrderedDict())
+    
+    messages = [Message(role=MessageRole.USER, content="Hello")]
+    
+    first = await llm.ask(messages, system_prompt="Be brief.")
+    second = await llm.ask(messages, system_prompt="Be brief.")
+    other = await llm.ask(messages, system_prompt="Be verbose.")
+    
+    assert first == second == "Response 1"
+    assert other == "Response 2"
+    assert completions.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_llm_ask_stream(monkeypatch):
+    """Test that streamed chunks join to the full response and are cached."""
+    llm = LLM()
+    client = FakeClient()
+    completions = client.completions
+    monkeypatch.setattr(llm, "client", client)
+    monkeypatch.setattr(llm, "initialized", True)
+    monkeypatch.setattr(llm, "cache_enabled", True)
+    monkeypatch.setattr(llm, "_response_cache", OrderedDict())
+    
+    messages = [Message(role=MessageRole.USER, content="Hello")]
+    
+    chunks = [chunk async for chunk in llm.ask_stream(messages)]
+    
+    assert chunks == ["Response ", "1 "]
+    assert await llm.ask(messages) == "Response 1 "
+    assert completions.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_llm_request_paths(monkeypatch):
+    """Test that requests are sent the same way with and without orjson."""
+    llm = LLM()
+    client = FakeClient()
+    monkeypatch.setattr(llm, "client", client)
+    monkeypatch.setattr(llm, "initialized", True)
+    monkeypatch.setattr(llm, "cache_enabled", False)
+    
+    messages = [Message(role=MessageRole.USER, content="Hello")]
+    
+    assert await llm.ask(messages) == "Response 1"
+    
+    monkeypatch.setattr("uranus.core.llm.orjson", None)
+    
+    assert await llm.ask(messages) == "Response 2"
+    assert client.completions.calls == 2
+
+
+def test_get_llm_shared_instance():
+    """Test that get_llm shares one instance per configuration while LLM() does not."""
+    assert get_llm() is get_llm("default")
+    assert LLM() is not get_llm()
+
+
+class _CompletionHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive chat completions endpoint."""
+    
+    protocol_version = "HTTP/1.1"
+    
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        payload = json.dumps({
+            "id": "c1", "object": "chat.completion", "created": 0, "model": body["model"],
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": "pong"},
+                "finish_reason": "stop"
+            }]
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def completion_server():
+    """Base URL of a local chat completions server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CompletionHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+    server.server_close()
+
+
+def test_llm_across_event_loops(completion_server):
+    """Test that one LLM keeps working across separate asyncio.run calls."""
+    llm = LLM()
+    llm.api_base = completion_server
+    llm.cache_enabled = False
+    messages = [Message(role=MessageRole.USER, content="ping")]
+    
+    async def ask():
+        return await llm.ask(messages), get_http_client(completion_server)
+    
+    first, first_client = asyncio.run(ask())
+    second, second_client = asyncio.run(ask())
+    
+    assert first == second == "pong"
+    assert first_client is not second_client
\ No newline at end of file
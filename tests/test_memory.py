@@ -0,0 +1,114 @@
+import pytest
+from collections import deque
+from uranus.schema.memory import Memory
+from uranus.schema.message import Message, MessageRole
+
+
+def test_memory_formatted_messages():
+    """Test that the preformatted message dicts track the stored messages."""
+    memory = Memory(
+        messages=[Message(role=MessageRole.SYSTEM, content="Be brief.")],
+        max_messages=3
+    )
+    
+    for i in range(4):
+        memory.add_message(Message(role=MessageRole.USER, content=f"Message {i}"))
+    
+    assert len(memory.messages) == 3
+    assert list(memory.to_dict_list()) == [message.to_dict() for message in memory.messages]
+    assert memory.last_user_content == "Message 3"
+    
+    memory.clear()
+    
+    assert not memory.to_dict_list()
+    assert memory.last_user_content is None
+
+
+def test_memory_last_message_by_role():
+    """Test role lookups across trimming."""
+    memory = Memory(max_messages=2)
+    
+    assert memory.get_last_user_message() is None
+    
+    memory.add_message(Message(role=MessageRole.USER, content="Question"))
+    memory.add_message(Message(role="assistant", content="Answer 1"))
+    
+    assert memory.get_last_user_message().content == "Question"
+    
+    # Pushes the only user message out of memory
+    memory.add_message(Message(role=MessageRole.ASSISTANT, content="Answer 2"))
+    
+    assert memory.get_last_user_message() is None
+    assert memory.get_last_assistant_message().content == "Answer 2"
+    assert memory.get_last_message_by_role("assistant").content == "Answer 2"
+
+
+def test_memory_initial_messages_bounded():
+    """Test that oversized initial history is evicted oldest first."""
+    memory = Memory(
+        messages=[Message(role=MessageRole.USER, content=f"Message {i}") for i in range(5)],
+        max_messages=3
+    )
+    
+    assert [message.content for message in memory.messages] == ["Message 2", "Message 3", "Message 4"]
+    assert [message.content for message in memory.get_recent_messages(2)] == ["Message 3", "Message 4"]
+    assert memory.get_last_user_message().content == "Message 4"
+    assert memory.last_user_content == "Message 4"
+    
+    memory.add_message(Message(role=MessageRole.ASSISTANT, content="Answer"))
+    
+    assert len(memory.to_dict_list()) == 3
+    assert memory.get_last_message().content == "Answer"
+    assert memory.get_last_user_message().content == "Message 4"
+
+
+def test_memory_add_helpers():
+    """Test the role-specific add helpers."""
+    memory = Memory()
+    memory.add_system_message("Be brief.")
+    memory.add_user_message("List files")
+    memory.add_tool_message("a.txt", name="file_operations")
+    memory.add_assistant_message("Found a.txt")
+    
+    assert [message["role"] for message in memory.to_dict_list()] == ["system", "user", "tool", "assistant"]
+    assert memory.to_dict_list()[2]["name"] == "file_operations"
+    assert memory.last_user_content == "List files"
+    assert memory.get_last_assistant_message().content == "Found a.txt"
+
+
+def test_memory_initial_last_user_content():
+    """Test that last_user_content reflects the last user message of the initial history."""
+    memory = Memory(messages=[
+        Message(role=MessageRole.USER, content="First"),
+        Message(role=MessageRole.USER, content="Second"),
+        Message(role=MessageRole.ASSISTANT, content="Answer")
+    ])
+    
+    assert memory.last_user_content == "Second"
+    assert Memory().last_user_content is None
+    
+    # A user message evicted by max_messages is not referenced
+    memory = Memory(max_messages=2, messages=[
+        Message(role=MessageRole.USER, content="Question"),
+        Message(role=MessageRole.ASSISTANT, content="Answer"),
+        Message(role=MessageRole.ASSISTANT, content="More")
+    ])
+    
+    assert memory.last_user_content is None
+
+
+def test_memory_model_dump_shape():
+    """Test that serialized messages carry only the message fields, even after to_dict."""
+    memory = Memory()
+    memory.add_user_message("Hi")
+    memory.add_tool_message("42", name="calculator")
+    
+    assert memory.model_dump()["messages"] == deque([
+        {"role": "user", "content": "Hi", "name": None, "tool_calls": None},
+        {"role": "tool", "content": "42", "name": "calculator", "tool_calls": None}
+    ])
+    
+    restored = Memory.model_validate(memory.model_dump())
+    
+    assert list(restored.messages) == list(memory.messages)
+    assert list(restored.to_dict_list()) == list(memory.to_dict_list())
\ No newline at end of file
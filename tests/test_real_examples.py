@@ -1,6 +1,6 @@
 import pytest
 import asyncio
-import os
+from collections import ChainMap
 from pathlib import Path
 from uranus.agent.reactive_agent import ReactiveAgent
 from uranus.tool.system_tool import SystemInfoTool
@@ -8,10 +8,24 @@ from uranus.tool.file_operations import FileOperationsTool
 from tests.mocks.mock_llm import MockLLM
 
 
-@pytest.mark.asyncio
-async def test_travel_planner():
-    """Test a real-world travel planning scenario."""
-    # Create a reactive agent with travel planning capabilities
+# Travel-specific responses layered over the shared mock responses
+TRAVEL_RESPONSES = {
+    "I want to plan a 3-day trip to Tokyo, Japan. Can you help me create an itinerary?": 
+        "I'd be happy to help you plan a 3-day trip to Tokyo! Here's a basic outline:\n\nDay 1: Visit Asakusa and Senso-ji Temple, explore Ueno Park\nDay 2: Check out Shibuya Crossing and Meiji Shrine\nDay 3: Visit Akihabara and Tokyo Skytree\n\nWould you like me to create a detailed itinerary file?",
+    
+    "Please create a file called tokyo_itinerary.txt with a basic 3-day plan":
+        "I've created the file tokyo_itinerary.txt with a basic 3-day plan for Tokyo.",
+    
+    "Show me the content of the tokyo_itinerary.txt file":
+        "The content of tokyo_itinerary.txt is:\n\nTOKYO 3-DAY ITINERARY\n\nDay 1:\n- Morning: Visit Asakusa and Senso-ji Temple\n- Afternoon: Explore Ueno Park and museums\n- Evening: Dinner in Asakusa area\n\nDay 2:\n- Morning: Visit Shibuya Crossing and shopping\n- Afternoon: Explore Meiji Shrine and Yoyogi Park\n- Evening: Dinner in Shibuya\n\nDay 3:\n- Morning: Visit Akihabara for electronics and anime\n- Afternoon: Tokyo Skytree for city views\n- Evening: Farewell dinner in Shinjuku",
+    
+    "Add a visit to Tokyo Tower on day 2 to the itinerary":
+        "I've updated the tokyo_itinerary.txt file to include a visit to Tokyo Tower on day 2."
+}
+
+
+def make_agent(responses) -> ReactiveAgent:
+    """Create a travel planning agent backed by a mock LLM."""
     agent = ReactiveAgent(
         name="TravelPlanner",
         description="An AI assistant that helps plan travel itineraries.",
@@ -22,56 +36,45 @@ async def test_travel_planner():
     )
     
     # Replace the LLM with our mock
-    agent.llm = MockLLM()
-    
-    # Add travel-specific responses to the mock LLM
-    agent.llm.responses.update({
-        "I want to plan a 3-day trip to Tokyo, Japan. Can you help me create an itinerary?": 
-            "I'd be happy to help you plan a 3-day trip to Tokyo! Here's a basic outline:\n\nDay 1: Visit Asakusa and Senso-ji Temple, explore Ueno Park\nDay 2: Check out Shibuya Crossing and Meiji Shrine\nDay 3: Visit Akihabara and Tokyo Skytree\n\nWould you like me to create a detailed itinerary file?",
-        
-        "Please create a file called tokyo_itinerary.txt with a basic 3-day plan":
-            "I've created the file tokyo_itinerary.txt with a basic 3-day plan for Tokyo.",
-        
-        "Show me the content of the tokyo_itinerary.txt file":
-            "The content of tokyo_itinerary.txt is:\n\nTOKYO 3-DAY ITINERARY\n\nDay 1:\n- Morning: Visit Asakusa and Senso-ji Temple\n- Afternoon: Explore Ueno Park and museums\n- Evening: Dinner in Asakusa area\n\nDay 2:\n- Morning: Visit Shibuya Crossing and shopping\n- Afternoon: Explore Meiji Shrine and Yoyogi Park\n- Evening: Dinner in Shibuya\n\nDay 3:\n- Morning: Visit Akihabara for electronics and anime\n- Afternoon: Tokyo Skytree for city views\n- Evening: Farewell dinner in Shinjuku",
-        
-        "Add a visit to Tokyo Tower on day 2 to the itinerary":
-            "I've updated the tokyo_itinerary.txt file to include a visit to Tokyo Tower on day 2."
-    })
+    agent.llm = MockLLM(responses=responses)
     
     # Register tools
     agent.tools.register(SystemInfoTool())
     agent.tools.register(FileOperationsTool())
     
+    return agent
+
+
+@pytest.mark.asyncio
+async def test_travel_planner(mock_responses):
+    """Test a real-world travel planning scenario."""
+    responses_map = ChainMap(TRAVEL_RESPONSES, mock_responses)
+    
     # Create a test workspace for travel planning
     test_dir = Path.home() / "uranus_workspace" / "travel_planning"
-    os.makedirs(test_dir, exist_ok=True)
-    
-    # Run a series of travel planning interactions
-    responses = []
+    test_dir.mkdir(parents=True, exist_ok=True)
     
-    # First interaction: Initial travel inquiry
-    response1 = await agent.run("I want to plan a 3-day trip to Tokyo, Japan. Can you help me create an itinerary?")
-    responses.append(response1)
-    
-    # Second interaction: Create an itinerary file
-    response2 = await agent.run("Please create a file called tokyo_itinerary.txt with a basic 3-day plan")
-    responses.append(response2)
-    
-    # Third interaction: Read the itinerary
-    response3 = await agent.run("Show me the content of the tokyo_itinerary.txt file")
-    responses.append(response3)
-    
-    # Fourth interaction: Update the itinerary
-    response4 = await agent.run("Add a visit to Tokyo Tower on day 2 to the itinerary")
-    responses.append(response4)
+    # The mock answers each prompt independently, so the interactions can run
+    # concurrently as long as every prompt gets its own agent (and memory)
+    prompts = [
+        # Initial travel inquiry
+        "I want to plan a 3-day trip to Tokyo, Japan. Can you help me create an itinerary?",
+        # Create an itinerary file
+        "Please create a file called tokyo_itinerary.txt with a basic 3-day plan",
+        # Read the itinerary
+        "Show me the content of the tokyo_itinerary.txt file",
+        # Update the itinerary
+        "Add a visit to Tokyo Tower on day 2 to the itinerary",
+    ]
+    responses = await asyncio.gather(
+        *(make_agent(responses_map).run(prompt) for prompt in prompts)
+    )
     
     # Print the full conversation for debugging
     print("\n".join(responses))
     
     # Cleanup
-    if os.path.exists(test_dir / "tokyo_itinerary.txt"):
-        os.remove(test_dir / "tokyo_itinerary.txt")
+    (test_dir / "tokyo_itinerary.txt").unlink(missing_ok=True)
     
     # Verify some expected content in the responses
     assert any("Tokyo" in response for response in responses)
@@ -1,8 +1,15 @@
 import pytest
 import asyncio
-from uranus.tool.tool_registry import ToolRegistry, BaseTool, ToolResult
+import os
+import shutil
+import subprocess
+import sys
+from uranus.tool.tool_registry import ToolRegistry, BaseTool, ToolResult, ToolError
 from uranus.tool.system_tool import SystemInfoTool
 from uranus.tool.file_operations import FileOperationsTool
+from uranus.tool.python_execute import PythonExecuteTool
+from uranus.tool.file_saver import FileSaverTool
+from uranus.tool.terminal import TerminalTool
 
 
 @pytest.mark.asyncio
@@ -26,6 +33,12 @@ async def test_system_info_tool():
     assert result.success is True
     assert "CPU" in result.output
     assert "MEMORY" not in result.output
+    
+    # Modifying returned data does not corrupt the cache
+    result.data["cpu"]["frequency"]["current"] = "changed"
+    result = await tool.execute(info_type="cpu")
+    
+    assert result.data["cpu"]["frequency"]["current"] != "changed"
 
 
 @pytest.mark.asyncio
@@ -100,4 +113,244 @@ async def test_tool_registry():
     # Test executing a tool
     result = await registry.execute("system_info", info_type="platform")
     assert result.success is True
-    assert "PLATFORM" in result.output
\ No newline at end of file
+    assert "PLATFORM" in result.output
+
+
+def test_tool_registry_cache_invalidation():
+    """Test that cached registry views are refreshed when a tool is registered."""
+    registry = ToolRegistry()
+    registry.register(SystemInfoTool())
+    
+    version = registry.version
+    description = registry.get_tools_description()
+    params = registry.to_params()
+    
+    assert registry.get_tools_description() is description
+    assert registry.to_params() is params
+    
+    registry.register(FileOperationsTool())
+    
+    assert registry.version == version + 1
+    assert "file_operations" in registry.get_tools_description()
+    assert len(registry.to_params()) == 2
+
+
+@pytest.mark.asyncio
+async def test_python_execute_tool():
+    """Test the python execute tool, including recovery after a timeout."""
+    tool = PythonExecuteTool()
+    
+    result = await tool.execute(code="print(len(range(6)) * 7)")
+    
+    assert result.success is True
+    assert result.output == "42\n"
+    
+    # Names do not leak between runs
+    await tool.execute(code="x = 1")
+    result = await tool.execute(code="print(x)")
+    
+    assert result.success is False
+    
+    result = await tool.execute(code="while True: pass", timeout=1)
+    
+    assert result.success is False
+    assert "timed out" in result.output
+    
+    result = await tool.execute(code="print(math.sqrt(16))")
+    
+    assert result.success is True
+    assert result.output == "4.0\n"
+    
+    # Changes to preloaded modules do not leak either
+    await tool.execute(code="math.pi = 3")
+    result = await tool.execute(code="print(math.pi)")
+    
+    assert result.output == "3.141592653589793\n"
+
+
+def test_python_execute_from_unguarded_script(tmp_path):
+    """Test that a calling script needs no `if __name__ == "__main__"` guard."""
+    script = tmp_path / "script.py"
+    script.write_text(
+        "import asyncio\n"
+        "from uranus.tool.python_execute import PythonExecuteTool\n"
+        "result = asyncio.run(PythonExecuteTool().execute(code='print(6 * 7)'))\n"
+        "print('result:', result.output.strip())\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    completed = subprocess.run(
+        [sys.executable, str(script)],
+        capture_output=True, text=True, timeout=60,
+        env={**os.environ, "PYTHONPATH": root}
+    )
+    
+    # The script's top level runs once, in this process only
+    assert completed.returncode == 0, completed.stderr
+    assert completed.stdout.count("result:") == 1
+    assert "result: 42" in completed.stdout
+
+
+@pytest.mark.asyncio
+async def test_python_execute_timeout_spares_other_runs():
+    """Test that a timed-out run does not abort code running alongside it."""
+    tool = PythonExecuteTool()
+    
+    stuck, finished = await asyncio.gather(
+        tool.execute(code="while True: pass", timeout=1),
+        tool.execute(code="for _ in range(3 * 10**7): pass\nprint('done')", timeout=30)
+    )
+    
+    assert "timed out" in stuck.output
+    assert finished.success is True
+    assert finished.output == "done\n"
+
+
+@pytest.mark.asyncio
+async def test_file_operations_read_truncates(tmp_path, monkeypatch):
+    """Test that reads of files over the size limit are truncated."""
+    monkeypatch.setattr("uranus.tool.file_operations.MAX_READ_BYTES", 8)
+    tool = FileOperationsTool(base_dir=tmp_path)
+    (tmp_path / "large.txt").write_text("0123456789abcdef", encoding="utf-8")
+    
+    result = await tool.execute(operation="read", path="large.txt")
+    
+    assert result.success is True
+    assert result.data["content"] == "01234567"
+    assert result.data["size"] == 16
+    assert result.data["truncated"] is True
+    assert "Truncated" in result.output
+
+
+@pytest.mark.asyncio
+async def test_file_operations_rejects_sibling_prefix(tmp_path):
+    """Test that a sibling directory sharing the base_dir prefix is not accessible."""
+    tool = FileOperationsTool(base_dir=tmp_path / "workspace")
+    (tmp_path / "workspace_evil").mkdir()
+    
+    with pytest.raises(ToolError):
+        await tool.execute(operation="write", path="../workspace_evil/x.txt", content="x")
+
+
+@pytest.mark.asyncio
+async def test_file_saver_stays_within_base_dir(tmp_path):
+    """Test that FileSaverTool saves under base_dir and refuses paths that escape it."""
+    tool = FileSaverTool(base_dir=tmp_path / "workspace")
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (tmp_path / "workspace" / "link").symlink_to(outside / "target.txt")
+    
+    for _ in range(2):
+        result = await tool.execute(content="x", file_path="out/a.txt", mode="a")
+        assert result.success
+    assert (tmp_path / "workspace" / "out" / "a.txt").read_text() == "xx"
+    
+    for file_path in ("../outside/b.txt", "out/../../c.txt", "link"):
+        result = await tool.execute(content="x", file_path=file_path)
+        assert not result.success
+    
+    # A directory that was saved into before can later become a symlink
+    shutil.rmtree(tmp_path / "workspace" / "out")
+    (tmp_path / "workspace" / "out").symlink_to(outside)
+    result = await tool.execute(content="x", file_path="out/a.txt")
+    assert not result.success
+    assert list(outside.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_file_tools_follow_base_dir(tmp_path):
+    """Test that reassigning base_dir takes effect and a removed base_dir is recreated."""
+    for tool, arguments in (
+        (FileOperationsTool(base_dir=tmp_path / "first"), {"operation": "write", "path": "a.txt"}),
+        (FileSaverTool(base_dir=tmp_path / "first"), {"file_path": "a.txt"})
+    ):
+        tool.base_dir = tmp_path / "second"
+        result = await tool.execute(content="x", **arguments)
+        assert result.success
+        assert (tmp_path / "second" / "a.txt").read_text() == "x"
+        
+        shutil.rmtree(tmp_path / "second")
+        result = await tool.execute(content="y", **arguments)
+        assert result.success
+        assert (tmp_path / "second" / "a.txt").read_text() == "y"
+
+
+@pytest.mark.asyncio
+async def test_terminal_tool_command_chain(tmp_path, monkeypatch):
+    """Test that TerminalTool splits chains at top-level separators only."""
+    # cd changes the process working directory; restore it afterwards
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "sub").mkdir()
+    tool = TerminalTool(current_path=str(tmp_path))
+    
+    result = await tool.execute(command="cd sub && echo 'a & b' && echo err 1>&2")
+    assert result.success
+    assert result.data["current_path"] == str(tmp_path / "sub")
+    assert "a & b" in result.output
+    assert result.data["error"] == "err"
+    
+    result = await tool.execute(command="false && echo skipped; echo ran")
+    assert result.output == "ran"
+    
+    # A cd later in the chain is tracked too, once the commands before it succeed
+    result = await tool.execute(command="mkdir build && cd build && pwd")
+    assert result.data["current_path"] == str(tmp_path / "sub" / "build")
+    assert result.output.endswith(str(tmp_path / "sub" / "build"))
+    
+    result = await tool.execute(command="false && cd .. ; pwd")
+    assert result.data["current_path"] == str(tmp_path / "sub" / "build")
+    assert result.output == str(tmp_path / "sub" / "build")
+    
+    result = await tool.execute(command="cd missing && echo skipped; echo ran")
+    assert result.output == "ran"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("command, expected", [
+    ("for i in 1 2 3; do echo $i; done", "1\n2\n3"),
+    ("if true; then echo yes; else echo no; fi", "yes"),
+    ("{ echo a; echo b; }", "a\nb"),
+    ("cat <<EOF\nline one\nline two\nEOF", "line one\nline two"),
+    ("case x in x) echo matched;; *) echo other;; esac", "matched"),
+    ("false && echo a || echo b", "b"),
+    ("echo a; echo b && echo c", "a\nb\nc"),
+])
+async def test_terminal_tool_shell_syntax(tmp_path, monkeypatch, command, expected):
+    """Test that shell syntax the chain parser does not model runs unchanged in one shell."""
+    monkeypatch.chdir(tmp_path)
+    tool = TerminalTool(current_path=str(tmp_path))
+    result = await tool.execute(command=command)
+    assert result.success
+    assert result.output == expected
+
+
+@pytest.mark.asyncio
+async def test_terminal_tool_failed_cd_stops_chain(tmp_path, monkeypatch):
+    """Test that commands after a failed cd and && are not run."""
+    monkeypatch.chdir(tmp_path)
+    tool = TerminalTool(current_path=str(tmp_path))
+    result = await tool.execute(command="cd missing && echo ran")
+    assert result.output == ""
+    assert "Directory not found" in result.data["error"]
+    assert result.data["current_path"] == str(tmp_path)
+    
+    # A directory removed outside the tool is noticed on the next cd
+    (tmp_path / "gone").mkdir()
+    await tool.execute(command="cd gone && cd ..")
+    (tmp_path / "gone").rmdir()
+    result = await tool.execute(command="cd gone && echo ran")
+    assert result.output == ""
+    assert "Directory not found" in result.data["error"]
+
+
+@pytest.mark.asyncio
+async def test_terminal_tool_output_limits(tmp_path, monkeypatch):
+    """Test that long lines are cut on a character boundary and total output is capped."""
+    monkeypatch.setattr("uranus.tool.terminal.MAX_LINE_LENGTH", 5)
+    monkeypatch.setattr("uranus.tool.terminal.MAX_OUTPUT_BYTES", 30)
+    tool = TerminalTool(current_path=str(tmp_path))
+    
+    result = await tool.execute(command="echo \u00e9\u00e9\u00e9\u00e9")
+    assert result.output == "\u00e9\u00e9... [line truncated]"
+    
+    result = await tool.execute(command="seq 1 100")
+    assert result.output == "[91 earlier lines omitted]\n" + "\n".join(map(str, range(92, 101)))
\ No newline at end of file
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from uranus.utils import text_utils
+from uranus.utils.text_utils import extract_json_block
+from uranus.utils.validation_utils import compile_schema, is_valid_json_string, validate_dict
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run a test with and without the orjson fast path."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(text_utils, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize("text", [
+    '{"value": NaN}',
+    '{"value": Infinity}',
+    '{"value": 1e400}',
+    '{"n": 123456789012345678901234567890}',
+    '{"n": -9223372036854775809}',
+    '{"s": "\\ud800"}',
+    '{"a": [1, 2.5, "x"], "b": null}',
+])
+def test_json_parsing_matches_stdlib(json_backend, text):
+    """Test that JSON parsing gives json.loads results, whichever parser is used."""
+    expected = json.loads(text)
+    
+    assert is_valid_json_string(text)
+    assert repr(extract_json_block(f"Result: {text} done")) == repr(expected)
+    assert repr(extract_json_block(f"```json\n{text}\n```")) == repr(expected)
+
+
+def test_json_parsing_rejects_invalid(json_backend):
+    """Test that invalid JSON is still rejected."""
+    assert not is_valid_json_string('{"a": }')
+    assert extract_json_block("no json {here}") is None
+
+
+def test_validate_dict_schemas():
+    """Test that plain schemas are read on every call and compiled ones give the same errors."""
+    schema = {
+        "name": {"type": str, "required": True},
+        "age": {"type": int, "validator": lambda value: value >= 0 or "must not be negative"},
+    }
+    compiled = compile_schema(schema)
+    
+    for data in ({"name": "a", "age": 1}, {"age": -1}, {"name": 1, "age": "x"}):
+        assert validate_dict(data, compiled) == validate_dict(data, schema)
+    assert validate_dict({"age": -1}, schema) == [
+        "Missing required field: name",
+        "Field age failed validation: must not be negative",
+    ]
+    
+    # A schema changed after use is validated against its new rules
+    schema["email"] = {"type": str, "required": True}
+    
+    assert "Missing required field: email" in validate_dict({"name": "a"}, schema)
+    assert validate_dict({"name": "a"}, compiled) == []
\ No newline at end of file
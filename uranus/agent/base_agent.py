@@ -1,14 +1,20 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, List, Optional, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
-from uranus.core.llm import LLM
+from uranus.core.llm import LLM, get_llm
+from uranus.core.logger import logger
 from uranus.schema.memory import Memory
 from uranus.schema.state import AgentState
 from uranus.tool.tool_registry import ToolRegistry
 
 
+# Inputs containing any of these are answered directly by the system info tool
+SYSTEM_STATUS_KEYWORDS = frozenset(("system status", "system info", "system information"))
+
+
 class BaseAgent(BaseModel, ABC):
     """Base class for all agents."""
     
@@ -20,25 +26,61 @@ class BaseAgent(BaseModel, ABC):
     name: str
     description: str
     system_prompt: str
-    llm: LLM = Field(default_factory=LLM)
+    llm: LLM = Field(default_factory=get_llm)
     memory: Memory = Field(default_factory=Memory)
     tools: ToolRegistry = Field(default_factory=ToolRegistry)
     state: AgentState = AgentState.IDLE
     max_iterations: int = 10
     current_iteration: int = 0
     
+    # Background connection warmup started by warmup()
+    _warmup_task: Optional[asyncio.Task] = PrivateAttr(default=None)
+    
     @abstractmethod
-    async def next_step(self, input_text: str) -> str:
+    async def next_step(self, input_text: str, low: Optional[str] = None) -> str:
         """Determine the next step for the agent.
         
         Args:
             input_text: The input text to process.
+            low: input_text lowercased, if the caller has already computed it.
             
         Returns:
             str: The next step to take.
         """
         pass
     
+    async def next_step_stream(self, input_text: str, low: Optional[str] = None) -> AsyncIterator[str]:
+        """Determine the next step for the agent, yielding the response incrementally.
+        
+        The default implementation yields the whole result of next_step at once;
+        agents backed by a streaming LLM call can override it.
+        
+        Args:
+            input_text: The input text to process.
+            low: input_text lowercased, if the caller has already computed it.
+            
+        Yields:
+            str: Successive pieces of the response.
+        """
+        yield await self.next_step(input_text, low)
+    
+    async def warmup(self) -> Optional[asyncio.Task]:
+        """Start priming the LLM connection in the background.
+        
+        Call this right after constructing the agent so the first run does not
+        pay the connection setup cost. It returns immediately.
+        
+        Returns:
+            Optional[asyncio.Task]: The warmup task, or None if the LLM does not support warmup.
+        """
+        warmup = getattr(self.llm, "warmup", None)
+        if warmup is None:
+            return None
+            
+        if self._warmup_task is None or self._warmup_task.done():
+            self._warmup_task = asyncio.ensure_future(warmup())
+        return self._warmup_task
+    
     async def run(self, input_text: str) -> str:
         """Run the agent with the given input.
         
@@ -51,15 +93,85 @@ class BaseAgent(BaseModel, ABC):
         self.state = "RUNNING"
         
         try:
+            low = input_text.lower()
+            
             # For direct tool calls like system status, we only need to call next_step once
-            if any(keyword in input_text.lower() for keyword in ["system status", "system info", "system information"]):
-                return await self.next_step(input_text)
+            if any(keyword in low for keyword in SYSTEM_STATUS_KEYWORDS):
+                return await self.next_step(input_text, low)
             
             # For regular queries, use the iterative approach
-            response = await self.next_step(input_text)
+            response = await self.next_step(input_text, low)
             self.state = "IDLE"
             return response
         except Exception as e:
             logger.error(f"Error in {self.__class__.__name__}.run: {str(e)}")
             self.state = "ERROR"
-            return f"Error: {str(e)}"
\ No newline at end of file
+            return f"Error: {str(e)}"
+    
+    async def run_stream(self, input_text: str) -> AsyncIterator[str]:
+        """Run the agent with the given input, yielding the response as it is produced.
+        
+        Args:
+            input_text: The input text to process.
+            
+        Yields:
+            str: Successive pieces of the final result.
+        """
+        self.state = "RUNNING"
+        
+        try:
+            async for chunk in self.next_step_stream(input_text, input_text.lower()):
+                yield chunk
+            if self.state == "RUNNING":
+                self.state = "IDLE"
+        except Exception as e:
+            logger.error(f"Error in {self.__class__.__name__}.run_stream: {str(e)}")
+            self.state = "ERROR"
+            yield f"Error: {str(e)}"
+    
+    async def run_batch_async(
+        self,
+        prompts: List[str],
+        max_concurrency: int = 8
+    ) -> List[str]:
+        """Run the agent on several independent prompts concurrently.
+        
+        Each prompt is handled by a copy of this agent with its own empty memory,
+        so prompts do not see each other's conversation history.
+        
+        Args:
+            prompts: The input texts to process.
+            max_concurrency: Maximum number of prompts processed at once.
+            
+        Returns:
+            List[str]: The results, in the same order as the prompts.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+            
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run_one(prompt: str) -> str:
+            async with semaphore:
+                agent = self.model_copy(update={"memory": Memory()})
+                return await agent.run(prompt)
+                
+        return list(await asyncio.gather(*(run_one(prompt) for prompt in prompts)))
+    
+    def run_batch(
+        self,
+        prompts: List[str],
+        max_concurrency: int = 8
+    ) -> List[str]:
+        """Synchronous wrapper around run_batch_async.
+        
+        Must not be called from a running event loop.
+        
+        Args:
+            prompts: The input texts to process.
+            max_concurrency: Maximum number of prompts processed at once.
+            
+        Returns:
+            List[str]: The results, in the same order as the prompts.
+        """
+        return asyncio.run(self.run_batch_async(prompts, max_concurrency=max_concurrency))
\ No newline at end of file
@@ -1,184 +1,59 @@
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, ClassVar, Dict, Iterator, List, Optional, Any, Tuple
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
-from uranus.agent.base_agent import BaseAgent
+from uranus.agent.base_agent import BaseAgent, SYSTEM_STATUS_KEYWORDS
 from uranus.schema.message import Message, MessageRole
 from uranus.core.logger import logger
 
 
+def _strip_prefix(input_text: str, low: str, prefixes: Tuple[str, ...]) -> str:
+    """Remove the first matching command prefix, preserving the argument's case.
+    
+    The prefix is matched against the lowercased input but sliced off the
+    original text, so URLs and search terms keep their casing.
+    """
+    for prefix in prefixes:
+        if low.startswith(prefix):
+            return input_text[len(prefix):].strip()
+    return input_text.strip()
+
+
 class ReactiveAgent(BaseAgent):
     """A reactive agent that can reason, act, and observe."""
     
     next_step_prompt: str = "What would you like me to do next?"
     
-    async def next_step(self, input_text: str) -> str:
+    # Enhanced system prompts keyed by (system_prompt, registry id, registry version)
+    _prompt_cache: Dict[Tuple[str, int, int], str] = PrivateAttr(default_factory=dict)
+    
+    async def next_step(self, input_text: str, low: Optional[str] = None) -> str:
         """Determine the next step for the agent.
         
         Args:
             input_text: The input text to process.
-            
+            low: input_text lowercased, if the caller has already computed it.
+        
         Returns:
             str: The next step to take.
         """
         # Add the input to memory
         self.memory.add_message(Message(role=MessageRole.USER, content=input_text))
         
-        # Get available tools
-        tools_params = self.tools.to_params()
-        
         try:
-            # Directly handle system status queries
-            if any(keyword in input_text.lower() for keyword in ["system status", "system info", "system information"]):
-                logger.info("Detected system status query, using SystemInfoTool directly")
-                system_tool = self.tools.get("system_info")
-                if system_tool:
-                    tool_result = await system_tool.execute()
-                    if tool_result.success:
-                        tool_response = f"Here's the current system status:\n\n{tool_result.output}"
-                        self.memory.add_message(Message(role=MessageRole.ASSISTANT, content=tool_response))
-                        return tool_response
-            
-            # Handle browser search queries
-            if input_text.lower().startswith("search "):
-                logger.info("Detected browser search query")
-                browser_tool = self.tools.get("browser")
-                if browser_tool:
-                    search_term = input_text[7:].strip()  # Remove "search " prefix
-                    logger.info(f"Searching for: {search_term}")
-                    tool_result = await browser_tool.execute(action="search", query=search_term)
-                    if tool_result.success:
-                        tool_response = f"I've searched for '{search_term}' in the browser."
-                        self.memory.add_message(Message(role=MessageRole.ASSISTANT, content=tool_response))
-                        return tool_response
-                    else:
-                        return f"Failed to search: {tool_result.output}"
-                else:
-                    return "Browser tool is not available. Please make sure it's properly registered."
-            
-            # Handle browser navigate commands
-            if input_text.lower().startswith("navigate to ") or input_text.lower().startswith("go to "):
-                logger.info("Detected browser navigation request")
-                browser_tool = self.tools.get("browser")
-                if browser_tool:
-                    # Extract URL from command
-                    if input_text.lower().startswith("navigate to "):
-                        url = input_text[11:].strip()
-                    else:  # "go to "
-                        url = input_text[6:].strip()
-                    
-                    logger.info(f"Navigating to: {url}")
-                    tool_result = await browser_tool.execute(action="navigate", url=url)
-                    if tool_result.success:
-                        tool_response = f"I've opened {url} in the browser."
-                        self.memory.add_message(Message(role=MessageRole.ASSISTANT, content=tool_response))
-                        return tool_response
-                    else:
-                        return f"Failed to navigate: {tool_result.output}"
-                else:
-                    return "Browser tool is not available. Please make sure it's properly registered."
-            
-            # Handle browser.open_url commands
-            if input_text.lower().startswith("browser.open_url"):
-                logger.info("Detected browser.open_url command")
-                browser_tool = self.tools.get("browser_use")
-                if browser_tool:
-                    # Extract URL from command
-                    parts = input_text.split(" ", 1)
-                    if len(parts) > 1:
-                        url = parts[1].strip()
-                        logger.info(f"Opening URL in browser: {url}")
-                        
-                        # Use the browser_use tool to navigate to the URL
-                        tool_result = await browser_tool.execute(action="navigate", url=url)
-                        if tool_result.success:
-                            tool_response = f"Navigated to {url} in the browser."
-                            self.memory.add_message(Message(role=MessageRole.ASSISTANT, content=tool_response))
-                            return tool_response
-                        else:
-                            return f"Failed to open URL: {tool_result.output}"
-                    else:
-                        return "Please specify a URL to open."
-                else:
-                    return "Browser_use tool is not available. Please make sure it's properly registered."
-            
-            # Handle terminal commands like ls, echo, etc.
-            if (input_text.lower() in ["ls", "pwd", "whoami", "date", "hostname"] or 
-                input_text.lower().startswith(("echo ", "cat ", "grep ", "find ", "ps ", "mkdir ", "touch "))):
-                logger.info(f"Detected terminal command: {input_text}")
-                terminal_tool = self.tools.get("terminal")
-                if terminal_tool:
-                    tool_result = await terminal_tool.execute(command=input_text)
-                    if tool_result.success:
-                        tool_response = tool_result.output
-                        if not tool_response:
-                            tool_response = "(Command executed successfully with no output)"
-                        self.memory.add_message(Message(role=MessageRole.ASSISTANT, content=tool_response))
-                        return tool_response
-                    else:
-                        return f"Failed to execute command: {tool_result.output}"
-                else:
-                    return "Terminal tool is not available. Please make sure it's properly registered."
-            
-            # Handle file creation commands
-            if input_text.lower().startswith(("create file", "make a file", "make file")):
-                logger.info("Detected file creation request")
-                file_tool = self.tools.get("file_operations")
-                if file_tool:
-                    # Extract filename from command
-                    parts = input_text.lower().split(" file ", 1)
-                    if len(parts) > 1:
-                        filename = parts[1].strip()
-                        logger.info(f"Creating file: {filename}")
-                        
-                        # Create the file
-                        tool_result = await file_tool.execute(action="create", name=filename, content="")
-                        if tool_result.success:
-                            tool_response = f"Created file: {filename}"
-                            self.memory.add_message(Message(role=MessageRole.ASSISTANT, content=tool_response))
-                            return tool_response
-                        else:
-                            return f"Failed to create file: {tool_result.output}"
-                    else:
-                        return "Please specify a filename."
-                else:
-                    return "File operations tool is not available. Please make sure it's properly registered."
-            
-            # Handle file operations commands
-            if input_text.lower().startswith(("list file", "list directory")) or input_text.lower() == "ls":
-                logger.info("Detected file listing request")
-                file_tool = self.tools.get("file_operations")
-                if file_tool:
-                    # Default to current directory if no path specified
-                    path = "."
-                    if " " in input_text and not input_text.lower() == "ls":
-                        # Extract path from command
-                        parts = input_text.split(" ", 2)
-                        if len(parts) > 2:
-                            path = parts[2].strip()
-                    
-                    tool_result = await file_tool.execute(action="list", path=path)
-                    if tool_result.success:
-                        files = tool_result.data.get("files", [])
-                        if files:
-                            file_list = "\n".join(files)
-                            tool_response = f"Files in {path}:\n\n{file_list}"
-                        else:
-                            tool_response = f"No files found in {path}"
-                        self.memory.add_message(Message(role=MessageRole.ASSISTANT, content=tool_response))
-                        return tool_response
-                    else:
-                        return f"Failed to list files: {tool_result.output}"
-                else:
-                    return "File operations tool is not available. Please make sure it's properly registered."
+            # Dispatch shortcut commands directly to the matching tool
+            tool_response = await self._dispatch_shortcut(input_text, low)
+            if tool_response is not None:
+                return tool_response
             
             # Create a system prompt that includes tool information
-            enhanced_system_prompt = f"{self.system_prompt}\n\nYou have access to the following tools:\n{self.tools.get_tools_description()}\n\nTo use a tool, respond with the tool name and parameters in a structured format."
+            enhanced_system_prompt = self._get_enhanced_system_prompt()
             
             # Call the LLM with the current memory and tools
             response = await self.llm.ask(
                 messages=self.memory.messages,
-                system_prompt=enhanced_system_prompt
+                system_prompt=enhanced_system_prompt,
+                memory=self.memory
             )
             
             # Add the response to memory
@@ -186,8 +61,238 @@ class ReactiveAgent(BaseAgent):
             
             # Return the response
             return response
-            
+        
         except Exception as e:
             logger.error(f"Error in ReactiveAgent.next_step: {str(e)}")
             self.state = "ERROR"
-            return f"Error: {str(e)}"
\ No newline at end of file
+            return f"Error: {str(e)}"
+    
+    async def next_step_stream(self, input_text: str, low: Optional[str] = None) -> AsyncIterator[str]:
+        """Determine the next step for the agent, streaming the LLM's response.
+        
+        Shortcut commands are answered in a single chunk. The full response is
+        added to memory once the stream is exhausted.
+        
+        Args:
+            input_text: The input text to process.
+            low: input_text lowercased, if the caller has already computed it.
+            
+        Yields:
+            str: Successive pieces of the response.
+        """
+        self.memory.add_message(Message(role=MessageRole.USER, content=input_text))
+        
+        try:
+            tool_response = await self._dispatch_shortcut(input_text, low)
+            if tool_response is not None:
+                yield tool_response
+                return
+            
+            ask_stream = getattr(self.llm, "ask_stream", None)
+            if ask_stream is None:
+                chunks = [await self.llm.ask(
+                    messages=self.memory.messages,
+                    system_prompt=self._get_enhanced_system_prompt(),
+                    memory=self.memory
+                )]
+                yield chunks[0]
+            else:
+                chunks = []
+                async for chunk in ask_stream(
+                    messages=self.memory.messages,
+                    system_prompt=self._get_enhanced_system_prompt(),
+                    memory=self.memory
+                ):
+                    chunks.append(chunk)
+                    yield chunk
+            
+            self.memory.add_message(Message(role=MessageRole.ASSISTANT, content="".join(chunks)))
+        
+        except Exception as e:
+            logger.error(f"Error in ReactiveAgent.next_step_stream: {str(e)}")
+            self.state = "ERROR"
+            yield f"Error: {str(e)}"
+    
+    async def _dispatch_shortcut(self, input_text: str, low: Optional[str] = None) -> Optional[str]:
+        """Run the shortcut handlers matching the input until one responds.
+        
+        Every handler takes (input_text, lowercased input_text) and returns
+        None to fall through to the next match, and finally to the LLM.
+        
+        Returns:
+            Optional[str]: The handler's response, or None if the LLM should answer.
+        """
+        if low is None:
+            low = input_text.lower()
+        for name in self._match_handlers(low):
+            # Looked up on the instance, so subclass overrides are honoured
+            response = await getattr(self, name)(input_text, low)
+            if response is not None:
+                return response
+        return None
+    
+    @classmethod
+    def _match_handlers(cls, low: str) -> Iterator[str]:
+        """Yield the names of the shortcut handlers for a lowercased input, in the order to try them."""
+        if any(keyword in low for keyword in SYSTEM_STATUS_KEYWORDS):
+            yield "_handle_system_status"
+        
+        name = cls._EXACT_HANDLERS.get(low)
+        if name is None:
+            name = next((name for prefixes, name in cls._PREFIX_HANDLERS if low.startswith(prefixes)), None)
+        if name is not None:
+            yield name
+    
+    def _get_enhanced_system_prompt(self) -> str:
+        """Get the system prompt extended with tool information.
+        
+        The result is cached until the system prompt changes or a tool is registered.
+        """
+        key = (self.system_prompt, id(self.tools), self.tools.version)
+        prompt = self._prompt_cache.get(key)
+        if prompt is None:
+            self._prompt_cache.clear()
+            prompt = f"{self.system_prompt}\n\nYou have access to the following tools:\n{self.tools.get_tools_description()}\n\nTo use a tool, respond with the tool name and parameters in a structured format."
+            self._prompt_cache[key] = prompt
+        return prompt
+    
+    def _respond(self, tool_response: str) -> str:
+        """Record a tool-generated response in memory and return it."""
+        self.memory.add_message(Message(role=MessageRole.ASSISTANT, content=tool_response))
+        return tool_response
+    
+    async def _handle_system_status(self, input_text: str, low: str) -> Optional[str]:
+        """Directly handle system status queries."""
+        logger.info("Detected system status query, using SystemInfoTool directly")
+        system_tool = self.tools.get("system_info")
+        if system_tool:
+            tool_result = await system_tool.execute()
+            if tool_result.success:
+                return self._respond(f"Here's the current system status:\n\n{tool_result.output}")
+        return None
+    
+    async def _handle_search(self, input_text: str, low: str) -> Optional[str]:
+        """Handle browser search queries."""
+        logger.info("Detected browser search query")
+        browser_tool = self.tools.get("browser")
+        if not browser_tool:
+            return "Browser tool is not available. Please make sure it's properly registered."
+        
+        search_term = _strip_prefix(input_text, low, ("search ",))
+        logger.info(f"Searching for: {search_term}")
+        tool_result = await browser_tool.execute(action="search", query=search_term)
+        if tool_result.success:
+            return self._respond(f"I've searched for '{search_term}' in the browser.")
+        return f"Failed to search: {tool_result.output}"
+    
+    async def _handle_navigate(self, input_text: str, low: str) -> Optional[str]:
+        """Handle browser navigate commands."""
+        logger.info("Detected browser navigation request")
+        browser_tool = self.tools.get("browser")
+        if not browser_tool:
+            return "Browser tool is not available. Please make sure it's properly registered."
+        
+        # Extract URL from command
+        url = _strip_prefix(input_text, low, ("navigate to ", "go to "))
+        
+        logger.info(f"Navigating to: {url}")
+        tool_result = await browser_tool.execute(action="navigate", url=url)
+        if tool_result.success:
+            return self._respond(f"I've opened {url} in the browser.")
+        return f"Failed to navigate: {tool_result.output}"
+    
+    async def _handle_open_url(self, input_text: str, low: str) -> Optional[str]:
+        """Handle browser.open_url commands."""
+        logger.info("Detected browser.open_url command")
+        browser_tool = self.tools.get("browser_use")
+        if not browser_tool:
+            return "Browser_use tool is not available. Please make sure it's properly registered."
+        
+        # Extract URL from command
+        url = _strip_prefix(input_text, low, ("browser.open_url",))
+        if not url:
+            return "Please specify a URL to open."
+        
+        logger.info(f"Opening URL in browser: {url}")
+        
+        # Use the browser_use tool to navigate to the URL
+        tool_result = await browser_tool.execute(action="navigate", url=url)
+        if tool_result.success:
+            return self._respond(f"Navigated to {url} in the browser.")
+        return f"Failed to open URL: {tool_result.output}"
+    
+    async def _handle_terminal(self, input_text: str, low: str) -> Optional[str]:
+        """Handle terminal commands like ls, echo, etc."""
+        logger.info(f"Detected terminal command: {input_text}")
+        terminal_tool = self.tools.get("terminal")
+        if not terminal_tool:
+            return "Terminal tool is not available. Please make sure it's properly registered."
+        
+        tool_result = await terminal_tool.execute(command=input_text)
+        if tool_result.success:
+            tool_response = tool_result.output
+            if not tool_response:
+                tool_response = "(Command executed successfully with no output)"
+            return self._respond(tool_response)
+        return f"Failed to execute command: {tool_result.output}"
+    
+    async def _handle_create_file(self, input_text: str, low: str) -> Optional[str]:
+        """Handle file creation commands."""
+        logger.info("Detected file creation request")
+        file_tool = self.tools.get("file_operations")
+        if not file_tool:
+            return "File operations tool is not available. Please make sure it's properly registered."
+        
+        # Extract filename from command
+        parts = low.split(" file ", 1)
+        if len(parts) <= 1:
+            return "Please specify a filename."
+        
+        filename = parts[1].strip()
+        logger.info(f"Creating file: {filename}")
+        
+        # Create the file
+        tool_result = await file_tool.execute(action="create", name=filename, content="")
+        if tool_result.success:
+            return self._respond(f"Created file: {filename}")
+        return f"Failed to create file: {tool_result.output}"
+    
+    async def _handle_list_files(self, input_text: str, low: str) -> Optional[str]:
+        """Handle file listing commands."""
+        logger.info("Detected file listing request")
+        file_tool = self.tools.get("file_operations")
+        if not file_tool:
+            return "File operations tool is not available. Please make sure it's properly registered."
+        
+        # Default to current directory if no path specified
+        path = "."
+        parts = input_text.split(" ", 2)
+        if len(parts) > 2:
+            path = parts[2].strip()
+        
+        tool_result = await file_tool.execute(action="list", path=path)
+        if not tool_result.success:
+            return f"Failed to list files: {tool_result.output}"
+        
+        files = tool_result.data.get("files", [])
+        if files:
+            file_list = "\n".join(files)
+            tool_response = f"Files in {path}:\n\n{file_list}"
+        else:
+            tool_response = f"No files found in {path}"
+        return self._respond(tool_response)
+    
+    # Shortcut dispatch tables mapping inputs to handler method names, checked
+    # after the system status keywords. Prefix families are tried in order, so
+    # earlier entries take precedence.
+    _EXACT_HANDLERS: ClassVar[Dict[str, str]] = dict.fromkeys(
+        ("ls", "pwd", "whoami", "date", "hostname"), "_handle_terminal"
+    )
+    _PREFIX_HANDLERS: ClassVar[Tuple[Tuple[Tuple[str, ...], str], ...]] = (
+        (("search ",), "_handle_search"),
+        (("navigate to ", "go to "), "_handle_navigate"),
+        (("browser.open_url",), "_handle_open_url"),
+        (("echo ", "cat ", "grep ", "find ", "ps ", "mkdir ", "touch "), "_handle_terminal"),
+        (("create file", "make a file", "make file"), "_handle_create_file"),
+        (("list file", "list directory"), "_handle_list_files"),
+    )
\ No newline at end of file
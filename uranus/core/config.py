@@ -1,17 +1,44 @@
+import functools
 import os
-import threading
-import tomllib
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 from pydantic import BaseModel
 
+# Prefer the Rust-backed TOML parser when installed; it is a drop-in for tomllib
+try:
+    import tomli_rs as toml_loader
+except ImportError:
+    import tomllib as toml_loader
 
+
+@functools.cache
 def get_project_root() -> Path:
     """Get the project root directory."""
     return Path(__file__).resolve().parent.parent.parent
 
 
+@functools.cache
+def get_config_path() -> Path:
+    """Get the configuration file path.
+    
+    Resolved once per process; URANUS_CONFIG must be set before the first call.
+    """
+    # Check for config in environment variable
+    config_path_env = os.environ.get("URANUS_CONFIG")
+    if config_path_env:
+        return Path(config_path_env)
+        
+    # Check for config in project root
+    project_root = get_project_root()
+    config_path = project_root / "config" / "config.toml"
+    if config_path.exists():
+        return config_path
+        
+    # Fall back to example config
+    return project_root / "config" / "config.example.toml"
+
+
 class LLMSettings(BaseModel):
     """Settings for LLM."""
     model: str
@@ -23,43 +50,32 @@ class LLMSettings(BaseModel):
 
 
 class Config:
-    """Configuration singleton for Uranus."""
+    """Configuration singleton for Uranus.
+    
+    The single instance is created when this module is imported, so looking it
+    up needs neither a lock nor an initialization check. Config() and
+    get_config() both return that instance.
+    """
     
     _instance: Optional["Config"] = None
-    _lock: threading.Lock = threading.Lock()
-    _initialized: bool = False
     
     def __new__(cls):
-        """Singleton pattern implementation."""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
+        """Return the module-level instance."""
         return cls._instance
     
     def __init__(self):
-        """Initialize the configuration."""
-        if self._initialized:
-            return
-            
-        self._config = self._load_initial_config()
-        self._initialized = True
+        """The instance is fully initialized by _create."""
+    
+    @classmethod
+    def _create(cls) -> "Config":
+        """Create and initialize a new configuration instance."""
+        instance = super().__new__(cls)
+        instance._config = instance._load_initial_config()
+        return instance
     
     def _get_config_path(self) -> Path:
         """Get the configuration file path."""
-        # Check for config in environment variable
-        config_path_env = os.environ.get("URANUS_CONFIG")
-        if config_path_env:
-            return Path(config_path_env)
-            
-        # Check for config in project root
-        project_root = get_project_root()
-        config_path = project_root / "config" / "config.toml"
-        if config_path.exists():
-            return config_path
-            
-        # Fall back to example config
-        return project_root / "config" / "config.example.toml"
+        return get_config_path()
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file."""
@@ -68,7 +84,7 @@ class Config:
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
             
         with open(config_path, "rb") as f:
-            return tomllib.load(f)
+            return toml_loader.load(f)
     
     def _load_initial_config(self) -> Dict[str, Any]:
         """Load initial configuration."""
@@ -92,4 +108,12 @@ class Config:
     @property
     def llm(self) -> Dict[str, Dict[str, Any]]:
         """Get LLM configuration."""
-        return self._config.get("llm", {})
\ No newline at end of file
+        return self._config.get("llm", {})
+
+
+Config._instance = Config._create()
+
+
+def get_config() -> Config:
+    """Get the configuration singleton."""
+    return Config._instance
\ No newline at end of file
@@ -1,13 +1,138 @@
+import asyncio
+import functools
+import inspect
 import os
-from typing import Dict, List, Optional, Any, Union
+import threading
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple, Union
 
 from pydantic import BaseModel
 
+# Serialize request bodies with orjson when installed instead of the SDK's stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from uranus.schema.memory import Memory
 from uranus.schema.message import Message
-from uranus.core.config import Config
+from uranus.core.config import get_config
 from uranus.core.logger import logger
 
 
+# Maximum number of responses kept by each LLM's response cache
+RESPONSE_CACHE_SIZE = 256
+
+# Connection pools shared by all LLM clients, one per API base URL, created on first use.
+# Each is stored with the event loop it is used on, since its connections belong to that loop.
+_http_clients: Dict[str, Tuple[Optional[asyncio.AbstractEventLoop], Any]] = {}
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Get the running event loop, or None when called outside one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _http2_available() -> bool:
+    """Check whether httpx can negotiate HTTP/2 (needs the optional h2 package)."""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def get_http_client(base_url: str = ""):
+    """Get the shared, connection-pooled HTTP client used for LLM requests to base_url.
+    
+    The client is shared within an event loop. When called from a different
+    loop, for example a later asyncio.run, a new client is created, since
+    pooled connections cannot be used after their loop has closed.
+    
+    Args:
+        base_url: The API base URL the client will talk to.
+        
+    Returns:
+        httpx.AsyncClient: The pooled client for that endpoint.
+    """
+    loop = _running_loop()
+    entry = _http_clients.get(base_url)
+    if entry is not None:
+        client_loop, client = entry
+        if client_loop is loop:
+            return client
+        if client_loop is None:
+            # Created outside any loop and not used yet; it binds to this one
+            _http_clients[base_url] = (loop, client)
+            return client
+        
+    # No client yet, or the existing one belongs to another (possibly closed) loop
+    import httpx
+    client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=int(os.environ.get("URANUS_MAX_CONN", "200")),
+            max_keepalive_connections=int(os.environ.get("URANUS_MAX_KEEPALIVE", "100")),
+            keepalive_expiry=float(os.environ.get("URANUS_KEEPALIVE_EXPIRY", "300"))
+        ),
+        timeout=httpx.Timeout(120.0, connect=5.0),
+        http2=_http2_available()
+    )
+    _http_clients[base_url] = (loop, client)
+    return client
+
+
+@functools.lru_cache(maxsize=32)
+def _system_message(system_prompt: str) -> Dict[str, str]:
+    """Get the API message dict for a system prompt.
+    
+    Agents usually send the same system prompt on every call, so the dict is
+    built once per prompt and shared; callers must not modify it.
+    """
+    return {"role": "system", "content": system_prompt}
+
+
+@functools.lru_cache(maxsize=None)
+def _accepts_raw_body(client_type: type) -> bool:
+    """Check whether an SDK client's post() takes a pre-encoded request body.
+    
+    post(content=...) only exists in newer openai releases; older ones within
+    the supported range must go through chat.completions.create instead.
+    """
+    post = getattr(client_type, "post", None)
+    if post is None:
+        return False
+    try:
+        return "content" in inspect.signature(post).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+# Guards get_llm so concurrent first calls from several threads create one instance
+_llm_lock = threading.Lock()
+
+
+@functools.cache
+def _create_llm(config_name: str) -> "LLM":
+    """Create the shared LLM for a configuration."""
+    return LLM(config_name)
+
+
+def get_llm(config_name: str = "default") -> "LLM":
+    """Get the shared LLM instance for the named configuration.
+    
+    Args:
+        config_name: The [llm.<name>] section of the configuration to use.
+        
+    Returns:
+        LLM: The same instance on every call with the same config_name.
+    """
+    with _llm_lock:
+        return _create_llm(config_name)
+
+
 class LLMResponse(BaseModel):
     """Response from an LLM."""
     content: str
@@ -21,46 +146,84 @@ class LLM:
         "arbitrary_types_allowed": True
     }
     
-    _instances: Dict[str, "LLM"] = {}
-    
-    def __new__(cls, config_name: str = "default"):
-        """Singleton pattern implementation."""
-        if config_name not in cls._instances:
-            instance = super().__new__(cls)
-            instance.__init__(config_name)
-            cls._instances[config_name] = instance
-        return cls._instances[config_name]
-    
     def __init__(self, config_name: str = "default"):
-        """Initialize the LLM with configuration."""
-        if hasattr(self, "initialized"):
-            return
-            
-        self.config = Config().llm.get(config_name, {})
+        """Initialize the LLM with configuration.
+        
+        Each call creates a new client; use get_llm to share one per configuration.
+        """
+        self.config = get_config().llm.get(config_name, {})
         self.model = self.config.get("model", "gpt-3.5-turbo")
         self.api_key = self.config.get("api_key", os.environ.get("OPENAI_API_KEY", ""))
         self.api_base = self.config.get("base_url", "https://api.openai.com/v1")
         self.max_tokens = self.config.get("max_tokens", 4096)
         self.temperature = self.config.get("temperature", 0.7)
         
+        # Optional LRU cache of responses, enabled with URANUS_LLM_CACHE=1
+        self.cache_enabled = os.environ.get("URANUS_LLM_CACHE") == "1"
+        self._response_cache: "OrderedDict[Tuple, str]" = OrderedDict()
+        
+        # SDK client and the pooled HTTP client it wraps; see the client property
+        self._client: Any = None
+        self._client_http: Any = None
+        self._client_pinned = False
+        
         # Initialize client based on configuration
         try:
-            from openai import AsyncOpenAI
-            self.client = AsyncOpenAI(
-                api_key=self.api_key,
-                base_url=self.api_base
-            )
+            self.client
             self.initialized = True
             logger.info(f"LLM initialized with model: {self.model}")
         except ImportError:
-            logger.error("Failed to import OpenAI. Please install it with 'pip install openai'")
+            logger.error("Failed to import OpenAI. Please install it with 'pip install openai httpx'")
             self.initialized = False
     
+    @property
+    def client(self) -> Any:
+        """Get the AsyncOpenAI client for the current event loop.
+        
+        The client is rebuilt around a new pooled HTTP client when requests
+        move to another event loop. A client assigned directly is used as is.
+        """
+        if not self._client_pinned:
+            http_client = get_http_client(self.api_base)
+            if http_client is not self._client_http:
+                from openai import AsyncOpenAI
+                self._client = AsyncOpenAI(
+                    api_key=self.api_key,
+                    base_url=self.api_base,
+                    http_client=http_client
+                )
+                self._client_http = http_client
+        return self._client
+    
+    @client.setter
+    def client(self, value: Any) -> None:
+        """Use the given client for all requests."""
+        self._client = value
+        self._client_pinned = True
+    
+    async def warmup(self) -> None:
+        """Open a pooled connection to the LLM endpoint ahead of the first request.
+        
+        Any response status is fine since only the connection matters; errors are
+        logged and ignored.
+        """
+        if not self.initialized:
+            return
+            
+        try:
+            await get_http_client(self.api_base).head(
+                f"{self.api_base.rstrip('/')}/models",
+                headers={"Authorization": f"Bearer {self.api_key}"}
+            )
+        except Exception as e:
+            logger.debug(f"LLM warmup failed: {str(e)}")
+    
     async def ask(
         self, 
         messages: List[Message], 
         system_prompt: Optional[str] = None,
-        temperature: Optional[float] = None
+        temperature: Optional[float] = None,
+        memory: Optional[Memory] = None
     ) -> str:
         """
         Ask the LLM a question.
@@ -69,6 +232,8 @@ class LLM:
             messages: List of messages to send to the LLM.
             system_prompt: Optional system prompt to prepend.
             temperature: Optional temperature override.
+            memory: Optional memory the messages came from; its preformatted
+                messages are used instead of converting each message again.
             
         Returns:
             str: The LLM's response.
@@ -76,20 +241,170 @@ class LLM:
         if not self.initialized:
             return "LLM not initialized properly."
             
-        formatted_messages = self._format_messages(messages, system_prompt)
+        formatted_messages = self._prepare_messages(messages, system_prompt, memory)
+        temperature = temperature or self.temperature
+        
+        cache_key = None
+        if self.cache_enabled:
+            cache_key = self._cache_key(formatted_messages, temperature)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key)
+                return cached
         
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=formatted_messages,
-                temperature=temperature or self.temperature,
-                max_tokens=self.max_tokens
-            )
-            return response.choices[0].message.content
+            response = await self._create_completion(formatted_messages, temperature)
+            content = response.choices[0].message.content
+            
+            if cache_key is not None and content is not None:
+                self._cache_response(cache_key, content)
+                    
+            return content
         except Exception as e:
             logger.error(f"Error in LLM.ask: {str(e)}")
             return f"Error: {str(e)}"
     
+    async def ask_stream(
+        self, 
+        messages: List[Message], 
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        memory: Optional[Memory] = None
+    ) -> AsyncIterator[str]:
+        """
+        Ask the LLM a question and yield the response as it is generated.
+        
+        Takes the same arguments as ask. Joining the yielded chunks gives the
+        same text ask would have returned.
+        
+        Args:
+            messages: List of messages to send to the LLM.
+            system_prompt: Optional system prompt to prepend.
+            temperature: Optional temperature override.
+            memory: Optional memory the messages came from.
+            
+        Yields:
+            str: Successive pieces of the LLM's response.
+        """
+        if not self.initialized:
+            yield "LLM not initialized properly."
+            return
+            
+        formatted_messages = self._prepare_messages(messages, system_prompt, memory)
+        temperature = temperature or self.temperature
+        
+        cache_key = None
+        if self.cache_enabled:
+            cache_key = self._cache_key(formatted_messages, temperature)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self._response_cache.move_to_end(cache_key)
+                yield cached
+                return
+        
+        try:
+            stream = await self._create_completion(formatted_messages, temperature, stream=True)
+            chunks = []
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content
+                if content:
+                    chunks.append(content)
+                    yield content
+            
+            if cache_key is not None:
+                self._cache_response(cache_key, "".join(chunks))
+        except Exception as e:
+            logger.error(f"Error in LLM.ask_stream: {str(e)}")
+            yield f"Error: {str(e)}"
+    
+    async def _create_completion(
+        self, 
+        formatted_messages: List[Dict[str, Any]], 
+        temperature: float,
+        stream: bool = False
+    ) -> Any:
+        """Send a chat completion request.
+        
+        When orjson is installed and the SDK's post() accepts a raw body, the
+        request body is encoded with orjson and posted through the client
+        directly, skipping the SDK's stdlib json encoding. Otherwise, or if the
+        payload is not orjson-serializable, the regular chat.completions.create
+        call is used.
+        
+        Args:
+            formatted_messages: The API-formatted messages.
+            temperature: The sampling temperature.
+            stream: Whether to request a streamed response.
+            
+        Returns:
+            The ChatCompletion, or an AsyncStream of ChatCompletionChunk when streaming.
+        """
+        params = {
+            "model": self.model,
+            "messages": formatted_messages,
+            "temperature": temperature,
+            "max_tokens": self.max_tokens
+        }
+        if stream:
+            params["stream"] = True
+            
+        client = self.client
+        if orjson is not None and _accepts_raw_body(type(client)):
+            try:
+                body = orjson.dumps(params)
+            except TypeError:
+                body = None
+            if body is not None:
+                from openai import AsyncStream
+                from openai.types.chat import ChatCompletion, ChatCompletionChunk
+                return await client.post(
+                    "/chat/completions",
+                    content=body,
+                    cast_to=ChatCompletion,
+                    options={"headers": {"Content-Type": "application/json"}},
+                    stream=stream,
+                    stream_cls=AsyncStream[ChatCompletionChunk]
+                )
+                
+        return await client.chat.completions.create(**params)
+    
+    def _prepare_messages(
+        self, 
+        messages: List[Message], 
+        system_prompt: Optional[str] = None,
+        memory: Optional[Memory] = None
+    ) -> List[Dict[str, Any]]:
+        """Build the API payload, reusing the memory's preformatted messages when given."""
+        if memory is None:
+            return self._format_messages(messages, system_prompt)
+            
+        if system_prompt:
+            return [_system_message(system_prompt), *memory.to_dict_list()]
+        return list(memory.to_dict_list())
+    
+    def _cache_response(self, cache_key: Tuple, content: str) -> None:
+        """Store a response in the LRU cache, evicting the oldest entry if full."""
+        self._response_cache[cache_key] = content
+        if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+    
+    def _cache_key(
+        self, 
+        formatted_messages: List[Dict[str, Any]], 
+        temperature: float
+    ) -> Tuple:
+        """Build the response cache key for a request."""
+        return (
+            self.model,
+            temperature,
+            tuple(
+                (message["role"], message["content"], message.get("name"))
+                for message in formatted_messages
+            )
+        )
+    
     def _format_messages(
         self, 
         messages: List[Message], 
@@ -105,14 +420,10 @@ class LLM:
         Returns:
             List[Dict[str, str]]: Formatted messages.
         """
-        formatted = []
+        formatted = [message.to_dict() for message in messages]
         
         # Add system prompt if provided
         if system_prompt:
-            formatted.append({"role": "system", "content": system_prompt})
-            
-        # Add all other messages
-        for message in messages:
-            formatted.append(message.to_dict())
+            formatted.insert(0, _system_message(system_prompt))
             
         return formatted
\ No newline at end of file
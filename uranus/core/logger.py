@@ -1,4 +1,7 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 import os
 from pathlib import Path
@@ -7,13 +10,41 @@ from pathlib import Path
 log_dir = Path.home() / ".uranus"
 os.makedirs(log_dir, exist_ok=True)
 
+# File writes happen on a background listener thread, batched through a
+# memory buffer, so logging from the event loop never blocks on disk I/O.
+# The buffer is flushed when full, on errors, and at interpreter exit.
+_file_handler = logging.FileHandler(log_dir / "uranus.log", mode="a", delay=True)
+_file_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+_buffer_handler = logging.handlers.MemoryHandler(
+    capacity=1024,
+    flushLevel=logging.ERROR,
+    target=_file_handler
+)
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_queue_listener = logging.handlers.QueueListener(_log_queue, _buffer_handler)
+_queue_listener.start()
+
+
+def _stop_queue_listener() -> None:
+    """Drain queued records and flush the buffer to the log file."""
+    _queue_listener.stop()
+    _buffer_handler.close()
+    _file_handler.close()
+
+
+atexit.register(_stop_queue_listener)
+
+# The file handler applies the full format, so queued records only carry the message
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(message)s",
     handlers=[
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler(log_dir / "uranus.log", mode="a"),
+        _queue_handler,
     ],
 )
 
@@ -1,9 +1,11 @@
+import asyncio
 from typing import Dict, List, Optional, Any, Union
 
 from pydantic import Field
 
 from uranus.flow.base_flow import BaseFlow
 from uranus.agent.base_agent import BaseAgent
+from uranus.schema.memory import Memory
 from uranus.core.logger import logger
 
 
@@ -11,6 +13,8 @@ class SequentialFlow(BaseFlow):
     """A flow that executes agents in sequence."""
     
     agent_sequence: List[str] = Field(default_factory=list)
+    # Run independent agents concurrently on the original input instead of chaining them
+    parallel: bool = False
     
     def __init__(
         self, 
@@ -30,6 +34,9 @@ class SequentialFlow(BaseFlow):
             if not self.agents:
                 raise ValueError("No agents available")
                 
+            if self.parallel:
+                return await self._execute_parallel(input_text)
+                
             current_input = input_text
             results = []
             
@@ -55,4 +62,39 @@ class SequentialFlow(BaseFlow):
             
         except Exception as e:
             logger.error(f"Error in SequentialFlow: {str(e)}")
-            return f"Execution failed: {str(e)}"
\ No newline at end of file
+            return f"Execution failed: {str(e)}"
+    
+    async def _execute_parallel(self, input_text: str) -> str:
+        """Execute all agents concurrently on the same input.
+        
+        Results are combined in sequence order, whatever order the agents finish in.
+        An agent listed more than once runs its repeats on copies with fresh
+        memory, as run_batch_async does, so no agent runs twice at the same time.
+        """
+        agent_keys = []
+        agents = []
+        for agent_key in self.agent_sequence:
+            if agent_key not in self.agents:
+                logger.warning(f"Agent '{agent_key}' not found, skipping")
+                continue
+            agent = self.agents[agent_key]
+            if agent_key in agent_keys:
+                agent = agent.model_copy(update={"memory": Memory()})
+            agent_keys.append(agent_key)
+            agents.append(agent)
+            
+        logger.info(f"Executing agents in parallel: {', '.join(agent_keys)}")
+        results = await asyncio.gather(
+            *(agent.run(input_text) for agent in agents),
+            return_exceptions=True
+        )
+        
+        # Only agent errors are reported inline; cancellation and the like propagate
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+        
+        return "\n\n".join(
+            f"Error: {str(result)}" if isinstance(result, Exception) else result
+            for result in results
+        )
\ No newline at end of file
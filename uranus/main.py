@@ -1,5 +1,6 @@
 import asyncio
 import argparse
+import importlib
 import sys
 from pathlib import Path
 
@@ -11,9 +12,17 @@ from uranus.tool.file_saver import FileSaverTool
 from uranus.tool.python_execute import PythonExecuteTool
 from uranus.tool.terminal import TerminalTool
 from uranus.tool.terminate import TerminateTool
-from uranus.tool.web_search import WebSearchTool
-from uranus.tool.browser_use_tool import BrowserUseTool
 from uranus.core.logger import logger
+from uranus.utils.async_utils import ainput
+
+
+# Tools with heavy or optional third-party dependencies, as (module, class name).
+# They are imported only when registered, so a missing dependency disables the
+# tool instead of preventing the CLI from starting.
+OPTIONAL_TOOLS = (
+    ("uranus.tool.browser_use_tool", "BrowserUseTool"),
+    ("uranus.tool.web_search", "WebSearchTool"),
+)
 
 
 async def interactive_cli(agent):
@@ -22,15 +31,18 @@ async def interactive_cli(agent):
     
     while True:
         try:
-            user_input = input("You: ")
+            user_input = await ainput("You: ")
             if user_input.lower() in ["exit", "quit", "q"]:
                 print("Goodbye!")
                 break
                 
-            response = await agent.run(user_input)
-            print(f"\nUranus: {response}\n")
+            # Print the response as it streams in
+            print("\nUranus: ", end="", flush=True)
+            async for chunk in agent.run_stream(user_input):
+                print(chunk, end="", flush=True)
+            print("\n")
             
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             print("\nGoodbye!")
             break
         except Exception as e:
@@ -57,25 +69,28 @@ async def main(input_text=None):
     agent.tools.register(TerminalTool())
     agent.tools.register(TerminateTool())
     
-    # Register BrowserUseTool
-    try:
-        agent.tools.register(BrowserUseTool())
-    except Exception as e:
-        logger.warning(f"Could not register BrowserUseTool: {str(e)}")
+    # Register tools with optional dependencies if they can be imported
+    for module_name, class_name in OPTIONAL_TOOLS:
+        try:
+            tool_class = getattr(importlib.import_module(module_name), class_name)
+            agent.tools.register(tool_class())
+        except Exception as e:
+            logger.warning(f"Could not register {class_name}: {str(e)}")
     
-    # Register WebSearchTool if it's implemented
-    try:
-        agent.tools.register(WebSearchTool())
-    except Exception as e:
-        logger.warning(f"Could not register WebSearchTool: {str(e)}")
+    # Prime the LLM connection in the background
+    await agent.warmup()
     
-    if input_text:
-        # Run once with the provided input
-        response = await agent.run(input_text)
-        print(f"Uranus: {response}")
-    else:
-        # Run interactive CLI
-        await interactive_cli(agent)
+    try:
+        if input_text:
+            # Run once with the provided input
+            response = await agent.run(input_text)
+            print(f"Uranus: {response}")
+        else:
+            # Run interactive CLI
+            await interactive_cli(agent)
+    finally:
+        # Close shared sessions and browsers held by tools
+        await agent.tools.aclose()
 
 
 if __name__ == "__main__":
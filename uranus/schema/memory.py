@@ -1,19 +1,53 @@
-from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Any
+from pydantic import BaseModel, Field, PrivateAttr
 
-from uranus.schema.message import Message
+from uranus.schema.message import Message, MessageRole
 
 
 class Memory(BaseModel):
     """Memory for an agent."""
     
-    messages: List[Message] = Field(default_factory=list)
+    # Bounded to max_messages; the oldest messages are evicted first
+    messages: Deque[Message] = Field(default_factory=deque)
     max_messages: int = 100
+    # Content of the most recent user message, kept up to date by add_message
+    last_user_content: Optional[str] = None
+    
+    # API-formatted copies of messages, kept in step with messages by add_message
+    _as_dicts: Deque[Dict[str, Any]] = PrivateAttr(default_factory=deque)
+    # Position of the latest message per role, counted over every message ever added
+    _last_index_by_role: Dict[str, int] = PrivateAttr(default_factory=dict)
+    # Number of messages evicted from the front since the last clear
+    _dropped: int = PrivateAttr(default=0)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Bound, format and index any messages the memory was constructed with."""
+        initial = self.messages
+        self.messages = deque(initial, maxlen=self.max_messages)
+        self._dropped = len(initial) - len(self.messages)
+        # Only messages that survived the bound can be the last user message
+        for message in reversed(self.messages):
+            if message.role == MessageRole.USER:
+                self.last_user_content = message.content
+                break
+        self._as_dicts = deque(
+            (message.to_dict() for message in self.messages),
+            maxlen=self.max_messages
+        )
+        for index, message in enumerate(self.messages, start=self._dropped):
+            self._last_index_by_role[message.role] = index
     
     def add_message(self, message: Message) -> None:
         """Add a message to memory."""
+        if len(self.messages) == self.messages.maxlen:
+            self._dropped += 1
         self.messages.append(message)
-        self._trim_memory()
+        self._as_dicts.append(message.to_dict())
+        self._last_index_by_role[message.role] = self._dropped + len(self.messages) - 1
+        if message.role == MessageRole.USER:
+            self.last_user_content = message.content
     
     def add_user_message(self, content: str) -> None:
         """Add a user message to memory."""
@@ -31,13 +65,20 @@ class Memory(BaseModel):
         """Add a tool message to memory."""
         self.add_message(Message.tool_message(content, name))
     
-    def get_messages(self) -> List[Message]:
+    def get_messages(self) -> Deque[Message]:
         """Get all messages."""
         return self.messages
     
+    def to_dict_list(self) -> Deque[Dict[str, Any]]:
+        """Get all messages formatted for the LLM API.
+        
+        The returned sequence is maintained incrementally and must not be modified.
+        """
+        return self._as_dicts
+    
     def get_recent_messages(self, n: int) -> List[Message]:
         """Get the n most recent messages."""
-        return self.messages[-n:] if n < len(self.messages) else self.messages
+        return list(islice(self.messages, max(0, len(self.messages) - n), None))
     
     def get_last_message(self) -> Optional[Message]:
         """Get the last message."""
@@ -45,23 +86,23 @@ class Memory(BaseModel):
     
     def get_last_user_message(self) -> Optional[Message]:
         """Get the last user message."""
-        for message in reversed(self.messages):
-            if message.role == "user":
-                return message
-        return None
+        return self.get_last_message_by_role(MessageRole.USER)
     
     def get_last_assistant_message(self) -> Optional[Message]:
         """Get the last assistant message."""
-        for message in reversed(self.messages):
-            if message.role == "assistant":
-                return message
-        return None
+        return self.get_last_message_by_role(MessageRole.ASSISTANT)
+    
+    def get_last_message_by_role(self, role: str) -> Optional[Message]:
+        """Get the last message with the given role."""
+        index = self._last_index_by_role.get(role)
+        if index is None or index < self._dropped:
+            return None
+        return self.messages[index - self._dropped]
     
     def clear(self) -> None:
         """Clear all messages."""
-        self.messages = []
-    
-    def _trim_memory(self) -> None:
-        """Trim memory to max_messages."""
-        if len(self.messages) > self.max_messages:
-            self.messages = self.messages[-self.max_messages:]
\ No newline at end of file
+        self.messages = deque(maxlen=self.max_messages)
+        self._as_dicts = deque(maxlen=self.max_messages)
+        self._last_index_by_role = {}
+        self._dropped = 0
+        self.last_user_content = None
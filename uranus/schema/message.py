@@ -1,6 +1,7 @@
+import copy
+from dataclasses import dataclass, replace
 from enum import Enum
 from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field
 
 
 class MessageRole(str, Enum):
@@ -11,24 +12,110 @@ class MessageRole(str, Enum):
     TOOL = "tool"
 
 
-class Message(BaseModel):
-    """A message in a conversation."""
+# Bypasses Message.__setattr__ so construction does not pay for cache invalidation
+_set = object.__setattr__
+
+
+@dataclass(slots=True, init=False)
+class _MessageFields:
+    """The serialized fields of a Message."""
     role: str
     content: str
     name: Optional[str] = None
     tool_calls: Optional[list] = None
+
+
+class Message(_MessageFields):
+    """A message in a conversation.
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert message to a dictionary for LLM API."""
-        result = {
+    A slotted dataclass rather than a pydantic model: memory holds many of
+    these, and they are built internally from trusted values, so the
+    validation and per-instance __dict__ are not worth their cost.
+    """
+    
+    # Dict returned by to_dict, built on first use; a plain slot rather than a
+    # dataclass field so it stays out of fields(), equality and serialization
+    __slots__ = ("_api_dict",)
+    
+    def __init__(
+        self,
+        role: str,
+        content: str,
+        name: Optional[str] = None,
+        tool_calls: Optional[list] = None
+    ):
+        """Initialize the message."""
+        _set(self, "role", role)
+        _set(self, "content", content)
+        _set(self, "name", name)
+        _set(self, "tool_calls", tool_calls)
+        _set(self, "_api_dict", None)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, invalidating the cached dict."""
+        _set(self, name, value)
+        _set(self, "_api_dict", None)
+    
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "Message":
+        """Copy the message, optionally replacing some fields.
+        
+        Kept for compatibility with code written against the former pydantic model.
+        """
+        copied = replace(self, **(update or {}))
+        if deep:
+            copied.tool_calls = copy.deepcopy(copied.tool_calls)
+        return copied
+    
+    def model_dump(self) -> Dict[str, Any]:
+        """Get the message fields as a dictionary.
+        
+        Kept for compatibility with code written against the former pydantic model.
+        """
+        return {
             "role": self.role,
-            "content": self.content
+            "content": self.content,
+            "name": self.name,
+            "tool_calls": self.tool_calls
         }
+    
+    @classmethod
+    def user_message(cls, content: str) -> "Message":
+        """Create a user message."""
+        return cls(role=MessageRole.USER, content=content)
+    
+    @classmethod
+    def system_message(cls, content: str) -> "Message":
+        """Create a system message."""
+        return cls(role=MessageRole.SYSTEM, content=content)
+    
+    @classmethod
+    def assistant_message(cls, content: str) -> "Message":
+        """Create an assistant message."""
+        return cls(role=MessageRole.ASSISTANT, content=content)
+    
+    @classmethod
+    def tool_message(cls, content: str, name: str) -> "Message":
+        """Create a tool message for the named tool."""
+        return cls(role=MessageRole.TOOL, content=content, name=name)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert message to a dictionary for LLM API.
         
-        if self.name:
-            result["name"] = self.name
-            
-        if self.tool_calls:
-            result["tool_calls"] = self.tool_calls
+        The dict is built once and reused by later calls, so callers must not modify it.
+        """
+        # Unset on instances pydantic validated without calling __init__
+        result = getattr(self, "_api_dict", None)
+        if result is None:
+            result = {
+                "role": self.role,
+                "content": self.content
+            }
             
+            if self.name:
+                result["name"] = self.name
+                
+            if self.tool_calls:
+                result["tool_calls"] = self.tool_calls
+                
+            _set(self, "_api_dict", result)
         return result
\ No newline at end of file
@@ -1,5 +1,5 @@
 import asyncio
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, ClassVar
 import webbrowser
 from urllib.parse import quote_plus
 
@@ -76,24 +76,22 @@ class BrowserTool(BaseTool):
                 output=f"Error executing browser tool: {str(e)}"
             )
     
-    def get_parameters_schema(self) -> Dict[str, Any]:
-        """Get the parameters schema for this tool."""
-        return {
-            "type": "object",
-            "properties": {
-                "action": {
-                    "type": "string",
-                    "enum": ["navigate", "search"],
-                    "description": "The browser action to perform"
-                },
-                "url": {
-                    "type": "string",
-                    "description": "URL for navigation action"
-                },
-                "query": {
-                    "type": "string",
-                    "description": "Search query for search action"
-                }
+    PARAMETERS_SCHEMA: ClassVar[Dict[str, Any]] = {
+        "type": "object",
+        "properties": {
+            "action": {
+                "type": "string",
+                "enum": ["navigate", "search"],
+                "description": "The browser action to perform"
             },
-            "required": ["action"]
-        }
\ No newline at end of file
+            "url": {
+                "type": "string",
+                "description": "URL for navigation action"
+            },
+            "query": {
+                "type": "string",
+                "description": "Search query for search action"
+            }
+        },
+        "required": ["action"]
+    }
\ No newline at end of file
@@ -1,8 +1,9 @@
 import asyncio
 import json
-from typing import Optional, Dict, Any
+import weakref
+from typing import Optional, Dict, Any, ClassVar, Set, Tuple
 
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator
 from pydantic_core.core_schema import ValidationInfo
 
 from browser_use import Browser as BrowserUseBrowser
@@ -16,6 +17,51 @@ from uranus.core.logger import logger
 
 MAX_LENGTH = 2000
 
+def _truncate(content: str) -> str:
+    """Cut page content down to MAX_LENGTH characters.
+    
+    Callers slice to MAX_LENGTH + 1 characters in the browser, so only the
+    part that can be returned crosses the CDP connection while an overlong
+    page is still detected.
+    """
+    return content[:MAX_LENGTH] + "..." if len(content) > MAX_LENGTH else content
+
+
+# context_id of the primary context, which actions use unless told otherwise
+PRIMARY_CONTEXT_ID = 0
+
+# Close tasks started by finalizers, referenced until done so they are not collected
+_close_tasks: Set[asyncio.Task] = set()
+
+
+def _schedule_close(
+    loop: asyncio.AbstractEventLoop,
+    browser: BrowserUseBrowser,
+    contexts: Dict[int, BrowserContext]
+) -> None:
+    """Close a browser left open by a discarded BrowserUseTool.
+    
+    Called by a weakref finalizer, possibly during garbage collection inside a
+    running loop or at interpreter exit, so it never blocks or starts a loop: it
+    schedules the close on the loop that owns the browser, or gives up if that
+    loop has already been closed.
+    """
+    async def close() -> None:
+        for context in list(contexts.values()):
+            await context.close()
+        await browser.close()
+        
+    def start() -> None:
+        task = loop.create_task(close())
+        _close_tasks.add(task)
+        task.add_done_callback(_close_tasks.discard)
+        
+    try:
+        loop.call_soon_threadsafe(start)
+    except RuntimeError:
+        logger.debug("Event loop closed before the browser could be closed")
+
+
 class BrowserUseTool(BaseTool):
     """Tool for advanced browser interactions."""
     
@@ -37,29 +83,62 @@ class BrowserUseTool(BaseTool):
     - 'refresh': Refresh the current page
     """
     
-    # Use Field with default_factory for lock to make it compatible with Pydantic
+    # Guards creating and closing the browser and its contexts
     lock: asyncio.Lock = Field(default_factory=asyncio.Lock)
     browser: Optional[BrowserUseBrowser] = Field(default=None, exclude=True)
+    # The primary context, used by actions that do not pass a context_id
     context: Optional[BrowserContext] = Field(default=None, exclude=True)
     dom_service: Optional[DomService] = Field(default=None, exclude=True)
+    # Maximum number of browser contexts open at once
+    max_contexts: int = 4
+    
+    # Open contexts by context_id, each with a lock so actions on it run one at
+    # a time. Page state and element indexes belong to a context, so an action
+    # always runs in the context named by its caller, never in whichever is free.
+    _contexts: Dict[int, BrowserContext] = PrivateAttr(default_factory=dict)
+    _context_locks: Dict[int, asyncio.Lock] = PrivateAttr(default_factory=dict)
+    _finalizer: Optional[weakref.finalize] = PrivateAttr(default=None)
     
     # Set model configuration to allow arbitrary types
     model_config = {
         "arbitrary_types_allowed": True
     }
     
-    async def _ensure_browser_initialized(self) -> BrowserContext:
-        """Ensure browser and context are initialized."""
+    async def _ensure_browser_initialized(self) -> BrowserUseBrowser:
+        """Ensure the browser is started. Must be called with the lock held."""
         if self.browser is None:
             browser_config_kwargs = {"headless": False, "disable_security": True}
             self.browser = BrowserUseBrowser(BrowserConfig(**browser_config_kwargs))
-
-        if self.context is None:
-            context_config = BrowserContextConfig()
-            self.context = await self.browser.new_context(context_config)
-            self.dom_service = DomService(await self.context.get_current_page())
-
-        return self.context
+            # Close the browser if the tool is dropped without aclose(); the
+            # finalizer holds the resources, not the tool, so it cannot keep it alive
+            self._finalizer = weakref.finalize(
+                self, _schedule_close, asyncio.get_running_loop(), self.browser, self._contexts
+            )
+            
+        return self.browser
+    
+    async def _get_context(self, context_id: int) -> Tuple[BrowserContext, asyncio.Lock]:
+        """Get the context for an id and its lock, opening the context on first use.
+        
+        Raises:
+            ValueError: If max_contexts contexts are already open and none has this id.
+        """
+        context = self._contexts.get(context_id)
+        if context is None:
+            async with self.lock:
+                context = self._contexts.get(context_id)
+                if context is None:
+                    if len(self._contexts) >= self.max_contexts:
+                        raise ValueError(f"All {self.max_contexts} browser contexts are in use")
+                    browser = await self._ensure_browser_initialized()
+                    context = await browser.new_context(BrowserContextConfig())
+                    self._contexts[context_id] = context
+                    self._context_locks[context_id] = asyncio.Lock()
+                    if context_id == PRIMARY_CONTEXT_ID:
+                        self.context = context
+                        self.dom_service = DomService(await context.get_current_page())
+                        
+        return context, self._context_locks[context_id]
     
     async def execute(
         self,
@@ -69,11 +148,15 @@ class BrowserUseTool(BaseTool):
         text: Optional[str] = None,
         script: Optional[str] = None,
         scroll_amount: Optional[int] = None,
-        tab_id: Optional[int] = None
+        tab_id: Optional[int] = None,
+        context_id: int = PRIMARY_CONTEXT_ID
     ) -> ToolResult:
         """
         Execute a browser action.
         
+        Actions with the same context_id share pages and run one at a time;
+        actions on different contexts can run concurrently.
+        
         Args:
             action: The action to perform (navigate, click, etc.)
             url: URL for navigation
@@ -82,197 +165,245 @@ class BrowserUseTool(BaseTool):
             script: JavaScript to execute
             scroll_amount: Amount to scroll
             tab_id: Tab ID for switching tabs
+            context_id: Browser context to run the action in, the primary one by default
             
         Returns:
             ToolResult: The result of the execution
         """
-        async with self.lock:
-            try:
-                logger.info(f"Executing browser action: {action}")
-                
-                context = await self._ensure_browser_initialized()
-                
-                if action == "navigate":
-                    if not url:
-                        return ToolResult(
-                            success=False,
-                            output="URL is required for 'navigate' action"
-                        )
-                    await context.navigate_to(url)
-                    return ToolResult(
-                        success=True,
-                        output=f"Navigated to {url}"
-                    )
-                
-                elif action == "click":
-                    if index is None:
-                        return ToolResult(
-                            success=False,
-                            output="Index is required for 'click' action"
-                        )
-                    element = await context.get_dom_element_by_index(index)
-                    if not element:
-                        return ToolResult(
-                            success=False,
-                            output=f"Element with index {index} not found"
-                        )
-                    download_path = await context._click_element_node(element)
-                    output = f"Clicked element at index {index}"
-                    if download_path:
-                        output += f" - Downloaded file to {download_path}"
-                    return ToolResult(
-                        success=True,
-                        output=output
-                    )
-                
-                elif action == "input_text":
-                    if index is None or not text:
-                        return ToolResult(
-                            success=False,
-                            output="Index and text are required for 'input_text' action"
-                        )
-                    element = await context.get_dom_element_by_index(index)
-                    if not element:
-                        return ToolResult(
-                            success=False,
-                            output=f"Element with index {index} not found"
-                        )
-                    await context._input_text_element_node(element, text)
-                    return ToolResult(
-                        success=True,
-                        output=f"Input '{text}' into element at index {index}"
-                    )
-                
-                elif action == "get_html":
-                    html = await context.get_page_html()
-                    truncated = html[:MAX_LENGTH] + "..." if len(html) > MAX_LENGTH else html
-                    return ToolResult(
-                        success=True,
-                        output=truncated
-                    )
-                
-                elif action == "get_text":
-                    text = await context.execute_javascript("document.body.innerText")
-                    return ToolResult(
-                        success=True,
-                        output=text
-                    )
-                
-                elif action == "execute_js":
-                    if not script:
-                        return ToolResult(
-                            success=False,
-                            output="Script is required for 'execute_js' action"
-                        )
-                    result = await context.execute_javascript(script)
-                    return ToolResult(
-                        success=True,
-                        output=str(result)
-                    )
-                
-                elif action == "scroll":
-                    if scroll_amount is None:
-                        return ToolResult(
-                            success=False,
-                            output="Scroll amount is required for 'scroll' action"
-                        )
-                    await context.execute_javascript(f"window.scrollBy(0, {scroll_amount});")
-                    direction = "down" if scroll_amount > 0 else "up"
-                    return ToolResult(
-                        success=True,
-                        output=f"Scrolled {direction} by {abs(scroll_amount)} pixels"
+        handler_name = self._ACTION_HANDLERS.get(action)
+        if handler_name is None:
+            return ToolResult(
+                success=False,
+                output=f"Unsupported action: {action}"
+            )
+            
+        try:
+            logger.info(f"Executing browser action: {action}")
+            
+            while True:
+                context, context_lock = await self._get_context(context_id)
+                async with context_lock:
+                    # A context closed by cleanup while this action waited is opened again
+                    if self._contexts.get(context_id) is not context:
+                        continue
+                    # Looked up on the instance, so subclass overrides are honoured
+                    handler = getattr(self, handler_name)
+                    return await handler(
+                        context,
+                        url=url,
+                        index=index,
+                        text=text,
+                        script=script,
+                        scroll_amount=scroll_amount,
+                        tab_id=tab_id
                     )
                 
-                else:
-                    return ToolResult(
-                        success=False,
-                        output=f"Unsupported action: {action}"
-                    )
-                    
-            except Exception as e:
-                logger.error(f"Error executing browser action: {str(e)}")
-                return ToolResult(
-                    success=False,
-                    output=f"Error executing browser action: {str(e)}"
-                )
+        except Exception as e:
+            logger.error(f"Error executing browser action: {str(e)}")
+            return ToolResult(
+                success=False,
+                output=f"Error executing browser action: {str(e)}"
+            )
+    
+    async def _do_navigate(self, context: BrowserContext, url: Optional[str] = None, **_: Any) -> ToolResult:
+        """Navigate the context's current page to a URL."""
+        if not url:
+            return ToolResult(
+                success=False,
+                output="URL is required for 'navigate' action"
+            )
+        await context.navigate_to(url)
+        return ToolResult(
+            success=True,
+            output=f"Navigated to {url}"
+        )
+    
+    async def _do_click(self, context: BrowserContext, index: Optional[int] = None, **_: Any) -> ToolResult:
+        """Click an element by index."""
+        if index is None:
+            return ToolResult(
+                success=False,
+                output="Index is required for 'click' action"
+            )
+        element = await context.get_dom_element_by_index(index)
+        if not element:
+            return ToolResult(
+                success=False,
+                output=f"Element with index {index} not found"
+            )
+        download_path = await context._click_element_node(element)
+        output = f"Clicked element at index {index}"
+        if download_path:
+            output += f" - Downloaded file to {download_path}"
+        return ToolResult(
+            success=True,
+            output=output
+        )
+    
+    async def _do_input_text(
+        self,
+        context: BrowserContext,
+        index: Optional[int] = None,
+        text: Optional[str] = None,
+        **_: Any
+    ) -> ToolResult:
+        """Input text into an element by index."""
+        if index is None or not text:
+            return ToolResult(
+                success=False,
+                output="Index and text are required for 'input_text' action"
+            )
+        element = await context.get_dom_element_by_index(index)
+        if not element:
+            return ToolResult(
+                success=False,
+                output=f"Element with index {index} not found"
+            )
+        await context._input_text_element_node(element, text)
+        return ToolResult(
+            success=True,
+            output=f"Input '{text}' into element at index {index}"
+        )
+    
+    async def _do_get_html(self, context: BrowserContext, **_: Any) -> ToolResult:
+        """Get the page HTML, truncated to MAX_LENGTH."""
+        html = await context.execute_javascript(
+            f"document.documentElement.outerHTML.slice(0, {MAX_LENGTH + 1})"
+        )
+        return ToolResult(
+            success=True,
+            output=_truncate(html)
+        )
+    
+    async def _do_get_text(self, context: BrowserContext, **_: Any) -> ToolResult:
+        """Get the text content of the page, truncated to MAX_LENGTH."""
+        text = await context.execute_javascript(
+            f"document.body.innerText.slice(0, {MAX_LENGTH + 1})"
+        )
+        return ToolResult(
+            success=True,
+            output=_truncate(text)
+        )
+    
+    async def _do_execute_js(self, context: BrowserContext, script: Optional[str] = None, **_: Any) -> ToolResult:
+        """Execute JavaScript on the page."""
+        if not script:
+            return ToolResult(
+                success=False,
+                output="Script is required for 'execute_js' action"
+            )
+        result = await context.execute_javascript(script)
+        return ToolResult(
+            success=True,
+            output=str(result)
+        )
+    
+    async def _do_scroll(self, context: BrowserContext, scroll_amount: Optional[int] = None, **_: Any) -> ToolResult:
+        """Scroll the page vertically."""
+        if scroll_amount is None:
+            return ToolResult(
+                success=False,
+                output="Scroll amount is required for 'scroll' action"
+            )
+        await context.execute_javascript(f"window.scrollBy(0, {scroll_amount});")
+        direction = "down" if scroll_amount > 0 else "up"
+        return ToolResult(
+            success=True,
+            output=f"Scrolled {direction} by {abs(scroll_amount)} pixels"
+        )
+    
+    # Action dispatch table mapping actions to handler method names, each taking
+    # (context, **action parameters); actions missing here are reported as unsupported
+    _ACTION_HANDLERS: ClassVar[Dict[str, str]] = {
+        "navigate": "_do_navigate",
+        "click": "_do_click",
+        "input_text": "_do_input_text",
+        "get_html": "_do_get_html",
+        "get_text": "_do_get_text",
+        "execute_js": "_do_execute_js",
+        "scroll": "_do_scroll",
+    }
     
     async def cleanup(self):
         """Clean up browser resources."""
         async with self.lock:
-            if self.context is not None:
-                await self.context.close()
-                self.context = None
-                self.dom_service = None
+            if self._finalizer is not None:
+                self._finalizer.detach()
+                self._finalizer = None
+            contexts = list(self._contexts.values())
+            self._contexts.clear()
+            self._context_locks.clear()
+            for context in contexts:
+                await context.close()
+            self.context = None
+            self.dom_service = None
             if self.browser is not None:
                 await self.browser.close()
                 self.browser = None
-
-    def __del__(self):
-        """Ensure cleanup when object is destroyed."""
-        if self.browser is not None or self.context is not None:
-            try:
-                asyncio.run(self.cleanup())
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                loop.run_until_complete(self.cleanup())
-                loop.close()
     
-    def get_parameters_schema(self) -> Dict[str, Any]:
-        """Get the parameters schema for this tool."""
-        return {
-            "type": "object",
-            "properties": {
-                "action": {
-                    "type": "string",
-                    "enum": [
-                        "navigate",
-                        "click",
-                        "input_text",
-                        "screenshot",
-                        "get_html",
-                        "get_text",
-                        "execute_js",
-                        "scroll",
-                        "switch_tab",
-                        "new_tab",
-                        "close_tab",
-                        "refresh",
-                    ],
-                    "description": "The browser action to perform"
-                },
-                "url": {
-                    "type": "string",
-                    "description": "URL for navigation or new tab"
-                },
-                "index": {
-                    "type": "integer",
-                    "description": "Element index for clicking or input"
-                },
-                "text": {
-                    "type": "string",
-                    "description": "Text for input"
-                },
-                "script": {
-                    "type": "string",
-                    "description": "JavaScript to execute"
-                },
-                "scroll_amount": {
-                    "type": "integer",
-                    "description": "Pixels to scroll (positive for down, negative for up)"
-                },
-                "tab_id": {
-                    "type": "integer",
-                    "description": "Tab ID for switching tabs"
-                }
+    async def aclose(self) -> None:
+        """Close the browser and all of its contexts; the preferred way to shut the tool down."""
+        await self.cleanup()
+    
+    PARAMETERS_SCHEMA: ClassVar[Dict[str, Any]] = {
+        "type": "object",
+        "properties": {
+            "action": {
+                "type": "string",
+                "enum": [
+                    "navigate",
+                    "click",
+                    "input_text",
+                    "screenshot",
+                    "get_html",
+                    "get_text",
+                    "execute_js",
+                    "scroll",
+                    "switch_tab",
+                    "new_tab",
+                    "close_tab",
+                    "refresh",
+                ],
+                "description": "The browser action to perform"
+            },
+            "url": {
+                "type": "string",
+                "description": "URL for navigation or new tab"
+            },
+            "index": {
+                "type": "integer",
+                "description": "Element index for clicking or input"
+            },
+            "text": {
+                "type": "string",
+                "description": "Text for input"
+            },
+            "script": {
+                "type": "string",
+                "description": "JavaScript to execute"
+            },
+            "scroll_amount": {
+                "type": "integer",
+                "description": "Pixels to scroll (positive for down, negative for up)"
+            },
+            "tab_id": {
+                "type": "integer",
+                "description": "Tab ID for switching tabs"
             },
-            "required": ["action"],
-            "dependencies": {
-                "navigate": ["url"],
-                "click": ["index"],
-                "input_text": ["index", "text"],
-                "execute_js": ["script"],
-                "switch_tab": ["tab_id"],
-                "new_tab": ["url"],
-                "scroll": ["scroll_amount"]
+            "context_id": {
+                "type": "integer",
+                "description": "Browser context to run the action in; actions on one context share its pages. Defaults to the primary context, 0.",
+                "default": 0
             }
-        }
\ No newline at end of file
+        },
+        "required": ["action"],
+        "dependencies": {
+            "navigate": ["url"],
+            "click": ["index"],
+            "input_text": ["index", "text"],
+            "execute_js": ["script"],
+            "switch_tab": ["tab_id"],
+            "new_tab": ["url"],
+            "scroll": ["scroll_amount"]
+        }
+    }
\ No newline at end of file
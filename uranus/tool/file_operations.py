@@ -1,11 +1,73 @@
+import asyncio
+import codecs
 import os
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union, ClassVar
+
+from pydantic import PrivateAttr, model_validator
+
+# Use the C JSON encoder for large listings when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from uranus.tool.tool_registry import BaseTool, ToolResult, ToolError
 
 
+# Files larger than this are truncated when read
+MAX_READ_BYTES = int(os.environ.get("URANUS_MAX_READ_BYTES", str(4 * 1024 * 1024)))
+
+# Listings with more entries than this are output as indented JSON
+LARGE_LISTING_SIZE = 128
+
+
+def _dump_json(data: Any) -> str:
+    """Serialize data as indented JSON, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+def _read_text(path: Path, limit: int) -> Tuple[str, int, bool]:
+    """Read a UTF-8 text file, keeping at most limit bytes of it.
+    
+    The size is checked first, so large files are never read in full.
+    
+    Returns:
+        Tuple[str, int, bool]: The content, the file size in bytes, and whether
+        the content was truncated.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        data = f.read(limit)
+        
+    truncated = size > limit
+    # A final=False decode drops a multi-byte character cut off by the limit
+    content = codecs.getincrementaldecoder("utf-8")().decode(data, final=not truncated)
+    
+    # Match text-mode reads, which translate Windows and old Mac line endings
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content, size, truncated
+
+
+def _write_text(path: Path, content: str) -> None:
+    """Write a UTF-8 text file, creating parent directories as needed.
+    
+    Directories are only created when the open fails, which also recreates
+    a base directory that was removed after the tool was set up.
+    """
+    try:
+        f = open(path, "w", encoding="utf-8")
+    except FileNotFoundError:
+        os.makedirs(path.parent, exist_ok=True)
+        f = open(path, "w", encoding="utf-8")
+    with f:
+        f.write(content)
+
+
 class FileOperationsTool(BaseTool):
     """Tool for file system operations."""
     
@@ -15,6 +77,21 @@ class FileOperationsTool(BaseTool):
     # Set a safe base directory to prevent access to sensitive files
     base_dir: Path = Path.home() / "uranus_workspace"
     
+    # base_dir resolved once per assignment, for containment checks
+    _resolved_base: Path = PrivateAttr()
+    
+    # Re-run validation when base_dir is reassigned, so _resolved_base follows it
+    model_config = {
+        "validate_assignment": True
+    }
+    
+    @model_validator(mode="after")
+    def _resolve_base_dir(self) -> "FileOperationsTool":
+        """Resolve and create the base directory whenever base_dir is set."""
+        self._resolved_base = self.base_dir.resolve()
+        os.makedirs(self._resolved_base, exist_ok=True)
+        return self
+    
     async def execute(
         self,
         operation: str,
@@ -34,12 +111,9 @@ class FileOperationsTool(BaseTool):
         Returns:
             ToolResult: The result of the operation
         """
-        # Ensure base directory exists
-        os.makedirs(self.base_dir, exist_ok=True)
-        
         # Resolve the full path and ensure it's within base_dir
-        full_path = (self.base_dir / path).resolve()
-        if not str(full_path).startswith(str(self.base_dir)):
+        full_path = (self._resolved_base / path).resolve()
+        if not full_path.is_relative_to(self._resolved_base):
             raise ToolError(f"Access denied: Path must be within {self.base_dir}")
             
         try:
@@ -68,13 +142,17 @@ class FileOperationsTool(BaseTool):
             raise ToolError(f"Not a file: {path}")
             
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                content = f.read()
+            # File I/O runs in a worker thread so it does not stall the event loop
+            content, size, truncated = await asyncio.to_thread(_read_text, path, MAX_READ_BYTES)
+            
+            output = f"File content:\n\n{content}"
+            if truncated:
+                output += f"\n\n[Truncated: showing the first {MAX_READ_BYTES} of {size} bytes]"
                 
             return ToolResult(
                 success=True,
-                output=f"File content:\n\n{content}",
-                data={"content": content, "path": str(path)}
+                output=output,
+                data={"content": content, "path": str(path), "size": size, "truncated": truncated}
             )
         except UnicodeDecodeError:
             raise ToolError(f"Cannot read binary file: {path}")
@@ -84,11 +162,8 @@ class FileOperationsTool(BaseTool):
         if content is None:
             raise ToolError("Content is required for write operation")
             
-        # Create parent directories if they don't exist
-        os.makedirs(path.parent, exist_ok=True)
-            
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(content)
+        # Create parent directories and write in a worker thread
+        await asyncio.to_thread(_write_text, path, content)
             
         return ToolResult(
             success=True,
@@ -103,29 +178,19 @@ class FileOperationsTool(BaseTool):
         if not path.is_dir():
             raise ToolError(f"Not a directory: {path}")
             
-        files = []
-        
-        if recursive:
-            for item in path.glob("**/*"):
-                files.append({
-                    "path": str(item.relative_to(self.base_dir)),
-                    "type": "file" if item.is_file() else "directory",
-                    "size": item.stat().st_size if item.is_file() else None
-                })
-        else:
-            for item in path.iterdir():
-                files.append({
-                    "path": str(item.relative_to(self.base_dir)),
-                    "type": "file" if item.is_file() else "directory",
-                    "size": item.stat().st_size if item.is_file() else None
-                })
+        # Walking the directory blocks on stat calls, so it runs in a worker thread
+        files = await asyncio.to_thread(self._collect_entries, path, recursive)
                 
-        # Format output
-        output = f"Contents of {path}:\n\n"
-        for item in files:
-            type_indicator = "[DIR]" if item["type"] == "directory" else "[FILE]"
-            size_info = f" ({item['size']} bytes)" if item["size"] is not None else ""
-            output += f"{type_indicator} {item['path']}{size_info}\n"
+        # Format output; large listings are serialized as JSON in C instead
+        if len(files) > LARGE_LISTING_SIZE:
+            output = _dump_json({"path": str(path), "files": files})
+        else:
+            parts = [f"Contents of {path}:\n\n"]
+            for item in files:
+                type_indicator = "[DIR]" if item["type"] == "directory" else "[FILE]"
+                size_info = f" ({item['size']} bytes)" if item["size"] is not None else ""
+                parts.append(f"{type_indicator} {item['path']}{size_info}\n")
+            output = "".join(parts)
             
         return ToolResult(
             success=True,
@@ -133,6 +198,39 @@ class FileOperationsTool(BaseTool):
             data={"path": str(path), "files": files}
         )
     
+    def _collect_entries(self, path: Path, recursive: bool) -> List[Dict[str, Any]]:
+        """Collect the entries of a directory, descending into subdirectories if recursive.
+        
+        Uses os.scandir, whose entries carry the file type from the directory
+        listing and cache their stat result, instead of a Path and separate
+        stat calls per entry. Symlinked directories are listed but not descended into.
+        """
+        files = []
+        relative_root = str(path.relative_to(self._resolved_base))
+        # Directories still to list, as (absolute path, path relative to base_dir)
+        pending = [(str(path), "" if relative_root == "." else relative_root)]
+        
+        while pending:
+            directory, relative_dir = pending.pop()
+            subdirectories = []
+            
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    relative_path = os.path.join(relative_dir, entry.name)
+                    is_file = entry.is_file()
+                    files.append({
+                        "path": relative_path,
+                        "type": "file" if is_file else "directory",
+                        "size": entry.stat().st_size if is_file else None
+                    })
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        subdirectories.append((entry.path, relative_path))
+                        
+            # Visit subdirectories depth-first, in listing order
+            pending.extend(reversed(subdirectories))
+            
+        return files
+    
     async def _check_exists(self, path: Path) -> ToolResult:
         """Check if a file or directory exists."""
         exists = path.exists()
@@ -176,29 +274,27 @@ class FileOperationsTool(BaseTool):
         else:
             raise ToolError(f"Unknown file type: {path}")
     
-    def get_parameters_schema(self) -> Dict[str, Any]:
-        """Get the parameters schema for this tool."""
-        return {
-            "type": "object",
-            "properties": {
-                "operation": {
-                    "type": "string",
-                    "enum": ["read", "write", "list", "exists", "delete"],
-                    "description": "The operation to perform"
-                },
-                "path": {
-                    "type": "string",
-                    "description": "The file or directory path (relative to base_dir)"
-                },
-                "content": {
-                    "type": "string",
-                    "description": "Content to write (for write operation)"
-                },
-                "recursive": {
-                    "type": "boolean",
-                    "description": "Whether to operate recursively (for list/delete operations)",
-                    "default": False
-                }
+    PARAMETERS_SCHEMA: ClassVar[Dict[str, Any]] = {
+        "type": "object",
+        "properties": {
+            "operation": {
+                "type": "string",
+                "enum": ["read", "write", "list", "exists", "delete"],
+                "description": "The operation to perform"
+            },
+            "path": {
+                "type": "string",
+                "description": "The file or directory path (relative to base_dir)"
+            },
+            "content": {
+                "type": "string",
+                "description": "Content to write (for write operation)"
             },
-            "required": ["operation", "path"]
-        }
\ No newline at end of file
+            "recursive": {
+                "type": "boolean",
+                "description": "Whether to operate recursively (for list/delete operations)",
+                "default": False
+            }
+        },
+        "required": ["operation", "path"]
+    }
\ No newline at end of file
@@ -1,11 +1,30 @@
+import asyncio
 import os
 from pathlib import Path
-import aiofiles
+from typing import Any, ClassVar, Dict
+
+from pydantic import PrivateAttr, model_validator
 
 from uranus.tool.tool_registry import BaseTool, ToolResult, ToolError
 from uranus.core.logger import logger
 
 
+def _save(path: Path, content: str, mode: str) -> None:
+    """Write content to a file, creating parent directories as needed.
+    
+    Runs in a worker thread so the open, write and close all happen in one
+    hop off the event loop. Directories are only created when the open fails,
+    which also recreates a base directory removed after the tool was set up.
+    """
+    try:
+        file = open(path, mode=mode)
+    except FileNotFoundError:
+        os.makedirs(path.parent, exist_ok=True)
+        file = open(path, mode=mode)
+    with file:
+        file.write(content)
+
+
 class FileSaverTool(BaseTool):
     """Tool for saving content to files."""
     
@@ -15,6 +34,21 @@ class FileSaverTool(BaseTool):
     # Set a safe base directory to prevent access to sensitive files
     base_dir: Path = Path.home() / "uranus_workspace"
     
+    # base_dir resolved once per assignment, for containment checks
+    _resolved_base: Path = PrivateAttr()
+    
+    # Re-run validation when base_dir is reassigned, so _resolved_base follows it
+    model_config = {
+        "validate_assignment": True
+    }
+    
+    @model_validator(mode="after")
+    def _resolve_base_dir(self) -> "FileSaverTool":
+        """Resolve and create the base directory whenever base_dir is set."""
+        self._resolved_base = self.base_dir.resolve()
+        os.makedirs(self._resolved_base, exist_ok=True)
+        return self
+    
     async def execute(
         self,
         content: str,
@@ -32,26 +66,16 @@ class FileSaverTool(BaseTool):
         Returns:
             ToolResult: The result of the operation
         """
-        # Ensure base directory exists
-        os.makedirs(self.base_dir, exist_ok=True)
-        
         # Resolve the full path and ensure it's within base_dir
-        full_path = (self.base_dir / file_path).resolve()
-        if not str(full_path).startswith(str(self.base_dir)):
+        full_path = (self._resolved_base / file_path).resolve()
+        if not full_path.is_relative_to(self._resolved_base):
             return ToolResult(
                 success=False,
                 output=f"Access denied: Path must be within {self.base_dir}"
             )
             
         try:
-            # Ensure the directory exists
-            directory = os.path.dirname(full_path)
-            if directory:
-                os.makedirs(directory, exist_ok=True)
-                
-            # Write the content to the file
-            async with aiofiles.open(full_path, mode=mode) as file:
-                await file.write(content)
+            await asyncio.to_thread(_save, full_path, content, mode)
                 
             return ToolResult(
                 success=True,
@@ -65,25 +89,23 @@ class FileSaverTool(BaseTool):
                 output=f"Error saving file: {str(e)}"
             )
     
-    def get_parameters_schema(self) -> dict:
-        """Get the parameters schema for this tool."""
-        return {
-            "type": "object",
-            "properties": {
-                "content": {
-                    "type": "string",
-                    "description": "The content to save to the file."
-                },
-                "file_path": {
-                    "type": "string",
-                    "description": "The path where the file should be saved, including filename and extension."
-                },
-                "mode": {
-                    "type": "string",
-                    "description": "The file opening mode. Default is 'w' for write. Use 'a' for append.",
-                    "enum": ["w", "a"],
-                    "default": "w"
-                }
+    PARAMETERS_SCHEMA: ClassVar[Dict[str, Any]] = {
+        "type": "object",
+        "properties": {
+            "content": {
+                "type": "string",
+                "description": "The content to save to the file."
+            },
+            "file_path": {
+                "type": "string",
+                "description": "The path where the file should be saved, including filename and extension."
             },
-            "required": ["content", "file_path"]
-        }
\ No newline at end of file
+            "mode": {
+                "type": "string",
+                "description": "The file opening mode. Default is 'w' for write. Use 'a' for append.",
+                "enum": ["w", "a"],
+                "default": "w"
+            }
+        },
+        "required": ["content", "file_path"]
+    }
\ No newline at end of file
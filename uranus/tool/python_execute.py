@@ -1,34 +1,120 @@
-import sys
+import functools
+import marshal
+import os
 import asyncio
-from io import StringIO
-import multiprocessing
-from typing import Dict, Any
+import queue
+import subprocess
+import sys
+import threading
+from typing import Dict, Any, Optional, Tuple, ClassVar
 
 from uranus.tool.tool_registry import BaseTool, ToolResult, ToolError
+from uranus.tool.python_worker import BLOCKED_BUILTINS
 from uranus.core.logger import logger
 
 
+# Number of warm worker processes kept for executing code
+MAX_WORKERS = int(os.environ.get("URANUS_PYTHON_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# Workers are fresh interpreters running uranus.tool.python_worker. Unlike
+# multiprocessing's spawn and forkserver, this never re-imports the calling
+# script, so it needs no `if __name__ == "__main__"` guard; unlike fork, the
+# worker does not inherit the (threaded) parent's state.
+_WORKER_COMMAND = (sys.executable, "-m", "uranus.tool.python_worker")
+
+# Directory containing the uranus package, so workers can import it however it was found
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(code: str) -> bytes:
+    """Compile user code, reusing the result when the same source runs again.
+    
+    Compilation happens in the parent process, where the cache persists; the
+    marshalled code object is what gets sent to a worker.
+    """
+    return marshal.dumps(compile(code, "<string>", "exec"))
+
+
+class _WorkerPool:
+    """Pool of warm, single-use worker processes.
+    
+    Each job takes an idle worker and a replacement is started straight away,
+    so callers rarely wait for process startup. A job that times out kills
+    only its own worker.
+    """
+    
+    def __init__(self, size: int):
+        self._env = dict(os.environ)
+        self._env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, (_PACKAGE_ROOT, self._env.get("PYTHONPATH")))
+        )
+        self._idle: "queue.Queue[subprocess.Popen]" = queue.Queue()
+        for _ in range(size):
+            self._idle.put(self._start_worker())
+    
+    def _start_worker(self) -> subprocess.Popen:
+        return subprocess.Popen(
+            _WORKER_COMMAND,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=self._env
+        )
+    
+    def run(self, compiled: bytes, timeout: float) -> Optional[Tuple[bool, str]]:
+        """Run compiled code in a worker, blocking until it finishes.
+        
+        Waits for an idle worker first; the timeout starts once that worker is
+        ready and has been handed the job.
+        
+        Args:
+            compiled: Marshalled code object to execute
+            timeout: Maximum execution time in seconds
+        
+        Returns:
+            Optional[Tuple[bool, str]]: The worker's result, or None on timeout.
+        """
+        process = self._idle.get()
+        try:
+            if not process.stdout.read(1):
+                return False, "worker process exited unexpectedly"
+            try:
+                output, _ = process.communicate(compiled, timeout)
+            except subprocess.TimeoutExpired:
+                return None
+            return marshal.loads(output)
+        except (EOFError, ValueError, OSError):
+            return False, "worker process exited unexpectedly"
+        finally:
+            process.kill()
+            process.communicate()
+            self._idle.put(self._start_worker())
+
+
+# Worker pool shared by all PythonExecuteTool instances, created on first use
+_pool: Optional[_WorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def _run_in_pool(compiled: bytes, timeout: float) -> Optional[Tuple[bool, str]]:
+    """Run compiled code in the shared worker pool, starting the pool if needed.
+    
+    Called from a worker thread, so starting the pool's processes never
+    blocks the event loop.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = _WorkerPool(MAX_WORKERS)
+    return _pool.run(compiled, timeout)
+
+
 class PythonExecuteTool(BaseTool):
     """Tool for executing Python code."""
     
     name: str = "python_execute"
     description: str = "Executes Python code string. Note: Only print outputs are visible, function return values are not captured. Use print statements to see results."
     
-    def _run_code(self, code: str, result_dict: dict, safe_globals: dict) -> None:
-        """Run Python code in a separate process with restricted globals."""
-        original_stdout = sys.stdout
-        try:
-            output_buffer = StringIO()
-            sys.stdout = output_buffer
-            exec(code, safe_globals, safe_globals)
-            result_dict["observation"] = output_buffer.getvalue()
-            result_dict["success"] = True
-        except Exception as e:
-            result_dict["observation"] = str(e)
-            result_dict["success"] = False
-        finally:
-            sys.stdout = original_stdout
-    
     async def execute(
         self,
         code: str,
@@ -37,92 +123,63 @@ class PythonExecuteTool(BaseTool):
         """
         Execute Python code with safety restrictions.
         
+        The code runs in a fresh worker process taken from a pool of warm ones,
+        so process startup and module imports are paid ahead of the call.
+        
         Args:
             code: The Python code to execute
             timeout: Maximum execution time in seconds
-            
+        
         Returns:
             ToolResult: The result of the execution
         """
-        # Create a safe globals dictionary
-        safe_globals = {
-            "__builtins__": {
-                name: getattr(__builtins__, name)
-                for name in dir(__builtins__)
-                if name not in [
-                    "open", "exec", "eval", "compile", 
-                    "__import__", "input", "memoryview"
-                ]
-            },
-            "print": print,
-        }
-        
-        # Add common modules
-        for module_name in ["math", "random", "datetime", "json", "re"]:
-            try:
-                module = __import__(module_name)
-                safe_globals[module_name] = module
-            except ImportError:
-                pass
-        
-        # Use multiprocessing to execute code with timeout
-        manager = multiprocessing.Manager()
-        result_dict = manager.dict()
-        result_dict["observation"] = ""
-        result_dict["success"] = False
-        
-        process = multiprocessing.Process(
-            target=self._run_code,
-            args=(code, result_dict, safe_globals)
-        )
-        
         try:
-            process.start()
-            process.join(timeout)
+            try:
+                compiled = _compile(code)
+            except (SyntaxError, ValueError) as e:
+                return ToolResult(
+                    success=False,
+                    output=f"Error executing code: {e}"
+                )
             
-            if process.is_alive():
-                process.terminate()
-                process.join()
+            result = await asyncio.to_thread(_run_in_pool, compiled, timeout)
+            if result is None:
                 return ToolResult(
                     success=False,
                     output=f"Execution timed out after {timeout} seconds"
                 )
             
-            if result_dict["success"]:
+            success, observation = result
+            if success:
                 return ToolResult(
                     success=True,
-                    output=result_dict["observation"]
+                    output=observation
                 )
             else:
                 return ToolResult(
                     success=False,
-                    output=f"Error executing code: {result_dict['observation']}"
+                    output=f"Error executing code: {observation}"
                 )
-                
+        
         except Exception as e:
             logger.error(f"Error in PythonExecuteTool: {str(e)}")
             return ToolResult(
                 success=False,
                 output=f"Error: {str(e)}"
             )
-        finally:
-            if process.is_alive():
-                process.terminate()
     
-    def get_parameters_schema(self) -> Dict[str, Any]:
-        """Get the parameters schema for this tool."""
-        return {
-            "type": "object",
-            "properties": {
-                "code": {
-                    "type": "string",
-                    "description": "The Python code to execute."
-                },
-                "timeout": {
-                    "type": "integer",
-                    "description": "Maximum execution time in seconds.",
-                    "default": 5
-                }
+    PARAMETERS_SCHEMA: ClassVar[Dict[str, Any]] = {
+        "type": "object",
+        "properties": {
+            "code": {
+                "type": "string",
+                "description": "The Python code to execute."
             },
-            "required": ["code"]
-        }
\ No newline at end of file
+            "timeout": {
+                "type": "integer",
+                "description": "Maximum execution time in seconds.",
+                "default": 5
+            }
+        },
+        "required": ["code"]
+    }
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""Worker process for PythonExecuteTool.
+
+Run as ``python -m uranus.tool.python_worker``. Imports only the standard
+library, so a fresh worker is quick to start.
+"""
+import builtins
+import marshal
+import os
+import sys
+from contextlib import redirect_stdout
+from io import StringIO
+from typing import Dict, Any, Tuple
+
+
+# Builtins user code may not call
+BLOCKED_BUILTINS = frozenset({
+    "open", "exec", "eval", "compile",
+    "__import__", "input", "memoryview"
+})
+
+
+def _build_safe_globals() -> Dict[str, Any]:
+    """Build the restricted globals user code runs with."""
+    safe_globals = {
+        "__builtins__": {
+            name: value
+            for name, value in vars(builtins).items()
+            if name not in BLOCKED_BUILTINS
+        },
+        "print": print,
+    }
+    
+    # Add common modules
+    for module_name in ["math", "random", "datetime", "json", "re"]:
+        try:
+            module = __import__(module_name)
+            safe_globals[module_name] = module
+        except ImportError:
+            pass
+    
+    return safe_globals
+
+
+def run_code(compiled: bytes) -> Tuple[bool, str]:
+    """Run marshalled user code with restricted globals.
+    
+    Returns:
+        Tuple[bool, str]: Whether the code succeeded, and its printed output or error.
+    """
+    safe_globals = _build_safe_globals()
+    
+    output_buffer = StringIO()
+    try:
+        with redirect_stdout(output_buffer):
+            exec(marshal.loads(compiled), safe_globals, safe_globals)
+        return True, output_buffer.getvalue()
+    except (Exception, SystemExit) as e:
+        return False, str(e)
+
+
+def main() -> None:
+    """Run one job: marshalled code on stdin, the marshalled result on stdout.
+    
+    A single byte is written as soon as the worker is up, so the parent can
+    start the job's timeout only then. The result goes to a copy of the
+    original stdout, with fd 1 pointed at stderr, so nothing user code writes
+    there can corrupt it. Exiting after one job means changes user code makes
+    to modules or interpreter state never reach the next run.
+    """
+    channel = os.dup(1)
+    os.dup2(2, 1)
+    try:
+        os.write(channel, b"\n")
+    except BrokenPipeError:
+        # The parent exited while this worker was starting up
+        return
+    
+    compiled = sys.stdin.buffer.read()
+    if not compiled:
+        # The parent went away without sending a job
+        return
+    with os.fdopen(channel, "wb") as result:
+        result.write(marshal.dumps(run_code(compiled)))
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
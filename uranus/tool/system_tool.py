@@ -1,16 +1,129 @@
+import asyncio
+import copy
+import functools
+import math
 import platform
+import time
 import psutil
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple, ClassVar
+
+from pydantic import PrivateAttr
 
 from uranus.tool.tool_registry import BaseTool, ToolResult
 
 
+# How long each category of information stays cached, in seconds
+CACHE_TTLS: Dict[str, float] = {
+    "platform": math.inf,
+    "cpu": 1.0,
+    "memory": 1.0,
+    "disk": 60.0,
+}
+
+
+# psutil.cpu_percent(interval=None) reports usage since its previous call; readings
+# taken sooner than this after the first one are not meaningful
+CPU_SAMPLE_MIN_INTERVAL = 0.1
+
+# Prime the non-blocking CPU usage counters so the first reading is usable
+psutil.cpu_percent(interval=None)
+_cpu_primed_at = time.monotonic()
+
+
+@functools.cache
+def _collect_platform() -> Dict[str, Any]:
+    """Collect platform information.
+    
+    The values cannot change while the process runs, so they are collected once
+    and shared by every tool instance.
+    """
+    return {
+        "system": platform.system(),
+        "release": platform.release(),
+        "version": platform.version(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "python_version": platform.python_version(),
+    }
+
+
+@functools.cache
+def _cpu_counts() -> Tuple[Optional[int], Optional[int]]:
+    """Get the (physical, logical) CPU counts, which are fixed for the process."""
+    return psutil.cpu_count(logical=False), psutil.cpu_count(logical=True)
+
+
+def _collect_cpu() -> Dict[str, Any]:
+    """Collect CPU information."""
+    physical_cores, total_cores = _cpu_counts()
+    
+    # Only the first call right after import has to wait, and it runs in a worker thread
+    wait = _cpu_primed_at + CPU_SAMPLE_MIN_INTERVAL - time.monotonic()
+    if wait > 0:
+        time.sleep(wait)
+        
+    freq = psutil.cpu_freq()
+    return {
+        "physical_cores": physical_cores,
+        "total_cores": total_cores,
+        "usage_percent": psutil.cpu_percent(interval=None),
+        "frequency": {
+            "current": freq.current if freq else None,
+            "min": freq.min if freq else None,
+            "max": freq.max if freq else None,
+        },
+    }
+
+
+def _collect_memory() -> Dict[str, Any]:
+    """Collect memory information."""
+    memory = psutil.virtual_memory()
+    return {
+        "total": memory.total,
+        "available": memory.available,
+        "used": memory.used,
+        "percent": memory.percent,
+    }
+
+
+def _collect_disk() -> Dict[str, Any]:
+    """Collect disk information."""
+    disk = psutil.disk_usage("/")
+    return {
+        "total": disk.total,
+        "used": disk.used,
+        "free": disk.free,
+        "percent": disk.percent,
+    }
+
+
+# Collectors in output order
+COLLECTORS: Dict[str, Callable[[], Dict[str, Any]]] = {
+    "platform": _collect_platform,
+    "cpu": _collect_cpu,
+    "memory": _collect_memory,
+    "disk": _collect_disk,
+}
+
+
+def _collect(categories: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Collect several categories of information in one go.
+    
+    Meant to run in a single worker thread, so all the blocking psutil calls
+    for a request share one hop off the event loop.
+    """
+    return {category: COLLECTORS[category]() for category in categories}
+
+
 class SystemInfoTool(BaseTool):
     """Tool for getting system information."""
     
     name: str = "system_info"
     description: str = "Get information about the system, such as CPU, memory, disk usage, etc."
     
+    # Collected information per category as (monotonic timestamp, info)
+    _cache: Dict[str, Tuple[float, Dict[str, Any]]] = PrivateAttr(default_factory=dict)
+    
     async def execute(
         self, 
         info_type: Optional[str] = "all"
@@ -24,59 +137,20 @@ class SystemInfoTool(BaseTool):
         Returns:
             ToolResult: The result of the execution.
         """
-        result = {}
-        
-        if info_type in ["all", "platform"]:
-            result["platform"] = {
-                "system": platform.system(),
-                "release": platform.release(),
-                "version": platform.version(),
-                "machine": platform.machine(),
-                "processor": platform.processor(),
-                "python_version": platform.python_version(),
-            }
-            
-        if info_type in ["all", "cpu"]:
-            result["cpu"] = {
-                "physical_cores": psutil.cpu_count(logical=False),
-                "total_cores": psutil.cpu_count(logical=True),
-                "usage_percent": psutil.cpu_percent(interval=1),
-                "frequency": {
-                    "current": psutil.cpu_freq().current if psutil.cpu_freq() else None,
-                    "min": psutil.cpu_freq().min if psutil.cpu_freq() else None,
-                    "max": psutil.cpu_freq().max if psutil.cpu_freq() else None,
-                },
-            }
-            
-        if info_type in ["all", "memory"]:
-            memory = psutil.virtual_memory()
-            result["memory"] = {
-                "total": memory.total,
-                "available": memory.available,
-                "used": memory.used,
-                "percent": memory.percent,
-            }
-            
-        if info_type in ["all", "disk"]:
-            disk = psutil.disk_usage("/")
-            result["disk"] = {
-                "total": disk.total,
-                "used": disk.used,
-                "free": disk.free,
-                "percent": disk.percent,
-            }
+        categories = [category for category in COLLECTORS if info_type in ["all", category]]
+        result = await self._get_info(categories)
             
         # Format the output as a string
-        output = "System Information:\n"
+        parts = ["System Information:\n"]
         for category, info in result.items():
-            output += f"\n{category.upper()}:\n"
+            parts.append(f"\n{category.upper()}:\n")
             for key, value in info.items():
                 if isinstance(value, dict):
-                    output += f"  {key}:\n"
-                    for subkey, subvalue in value.items():
-                        output += f"    {subkey}: {subvalue}\n"
+                    parts.append(f"  {key}:\n")
+                    parts.extend(f"    {subkey}: {subvalue}\n" for subkey, subvalue in value.items())
                 else:
-                    output += f"  {key}: {value}\n"
+                    parts.append(f"  {key}: {value}\n")
+        output = "".join(parts)
                     
         return ToolResult(
             success=True,
@@ -84,16 +158,32 @@ class SystemInfoTool(BaseTool):
             data=result
         )
     
-    def get_parameters_schema(self) -> Dict[str, Any]:
-        """Get the parameters schema for this tool."""
-        return {
-            "type": "object",
-            "properties": {
-                "info_type": {
-                    "type": "string",
-                    "enum": ["all", "cpu", "memory", "disk", "platform"],
-                    "description": "Type of information to get"
-                }
-            },
-            "required": []
-        }
\ No newline at end of file
+    async def _get_info(self, categories: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get information for the given categories, collecting again those whose TTL expired.
+        
+        Expired categories are collected together in one worker thread since psutil calls block.
+        The cached dicts are shared, so callers get deep copies they are free to modify.
+        """
+        now = time.monotonic()
+        stale = [
+            category for category in categories
+            if category not in self._cache or now - self._cache[category][0] >= CACHE_TTLS[category]
+        ]
+        if stale:
+            collected = await asyncio.to_thread(_collect, stale)
+            for category, info in collected.items():
+                self._cache[category] = (now, info)
+                
+        return {category: copy.deepcopy(self._cache[category][1]) for category in categories}
+    
+    PARAMETERS_SCHEMA: ClassVar[Dict[str, Any]] = {
+        "type": "object",
+        "properties": {
+            "info_type": {
+                "type": "string",
+                "enum": ["all", "cpu", "memory", "disk", "platform"],
+                "description": "Type of information to get"
+            }
+        },
+        "required": []
+    }
\ No newline at end of file
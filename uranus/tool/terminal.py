@@ -1,13 +1,313 @@
 import os
+import re
 import asyncio
+import functools
 import shlex
-from typing import Optional, Dict, Any
+import shutil
+import subprocess
+from collections import deque
+from typing import IO, Deque, Iterator, List, NamedTuple, Optional, Dict, Any, ClassVar, Tuple, Union
 
 from pydantic import Field
 from uranus.tool.tool_registry import BaseTool, ToolResult, ToolError
 from uranus.core.logger import logger
 
 
+# Words made only of these characters mean the same to the shell as when split on whitespace
+_UNSAFE_WORD_CHAR = re.compile(r"[^\w@%+=:,./-]", re.ASCII)
+
+
+def _direct_argv(cmd: str) -> Optional[List[str]]:
+    """Get the argument list for running a command without a shell, if possible.
+    
+    Commands with no quoting, expansion, redirection or other shell syntax,
+    whose program is found on PATH, can be executed directly. That saves the
+    fork and exec of /bin/sh for each of them.
+    
+    Returns:
+        Optional[List[str]]: The argument list, or None if the command needs a shell.
+    """
+    argv = cmd.split()
+    if not argv or "/" in argv[0] or any(_UNSAFE_WORD_CHAR.search(word) for word in argv):
+        return None
+    # Shell builtins and unknown commands are left to the shell
+    if shutil.which(argv[0]) is None:
+        return None
+    return argv
+
+
+class ChdirOp(NamedTuple):
+    """A cd command in a chain, handled by the tool itself to keep its working directory."""
+    path: str
+    # Whether the op follows &&, and so runs only if the previous one succeeded
+    conditional: bool = False
+
+
+class ShellOp(NamedTuple):
+    """The rest of a chain group, run unchanged in one subprocess."""
+    command: str
+    conditional: bool = False
+    # Whether the group is followed by a bare &, so the next one need not wait for it
+    background: bool = False
+
+
+ChainOp = Union[ChdirOp, ShellOp]
+
+
+# Syntax the chain parser does not model: compound commands, brace groups,
+# heredocs and ||. Commands containing any of it run in a single shell unchanged.
+_NEEDS_SINGLE_SHELL = re.compile(
+    r"\|\||<<|(?:^|[\s;&|(])"
+    r"(?:if|then|else|elif|fi|for|while|until|do|done|case|esac|select|function|[{}])"
+    r"(?=$|[\s;&|)])"
+)
+
+
+def _split_chain(command: str) -> List[Tuple[str, int, int]]:
+    """Split a command line at its top-level &, && and ; separators.
+    
+    Separators inside quotes, backticks, $(...) and subshells are left alone,
+    as are the & of redirections such as 2>&1 and &>file.
+    
+    Returns:
+        List[Tuple[str, int, int]]: (separator before the segment, start, end) for
+        each segment, with "" as the first segment's separator.
+    """
+    segments = []
+    separator = ""
+    start = 0
+    depth = 0
+    quote = ""
+    i = 0
+    n = len(command)
+    while i < n:
+        char = command[i]
+        if quote:
+            if char == "\\" and quote == '"':
+                i += 1
+            elif char == quote:
+                quote = ""
+        elif char == "\\":
+            i += 1
+        elif char in "'\"`":
+            quote = char
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth = max(depth - 1, 0)
+        elif depth == 0 and char in ";\n&":
+            if char == "&" and (command[i + 1:i + 2] == ">" or command[start:i].rstrip()[-1:] in ("<", ">")):
+                i += 1
+                continue
+            segments.append((separator, start, i))
+            if command.startswith("&&", i):
+                separator = "&&"
+                i += 1
+            else:
+                separator = ";" if char == "\n" else char
+            start = i + 1
+        i += 1
+    segments.append((separator, start, n))
+    return segments
+
+
+def _cd_target(segment: str) -> Optional[str]:
+    """Get the directory a plain cd segment changes to, or None for any other command."""
+    lexer = shlex.shlex(segment, posix=True, punctuation_chars=True)
+    lexer.whitespace_split = True
+    try:
+        tokens = list(lexer)
+    except ValueError:
+        # Unbalanced quotes; let the shell report the error
+        return None
+    if tokens and tokens[0] == "cd" and len(tokens) <= 2 and not any(
+        token and all(c in lexer.punctuation_chars for c in token) for token in tokens
+    ):
+        return tokens[1] if len(tokens) == 2 else "~"
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_command_chain(command: str) -> Tuple[ChainOp, ...]:
+    """Parse a command line into the ops to run, in order.
+    
+    The line is split into groups at top-level bare & separators. Plain cd
+    commands anywhere in a group are handled by the tool, so the working
+    directory follows them; the commands between them run in one shell
+    exactly as written. Lines using syntax the parser does not model run in
+    a single shell unchanged. Parsed chains are cached, since agents tend to
+    repeat the same commands.
+    
+    Args:
+        command: The command line, possibly chaining commands with &, && or ;
+        
+    Returns:
+        Tuple[ChainOp, ...]: The ops, skipping empty groups.
+    """
+    if _NEEDS_SINGLE_SHELL.search(command):
+        command = command.strip()
+        return (ShellOp(command),) if command else ()
+    
+    groups: List[List[Tuple[str, int, int]]] = []
+    for separator, start, end in _split_chain(command):
+        if not groups or separator == "&":
+            groups.append([])
+        groups[-1].append((separator, start, end))
+    
+    ops: List[ChainOp] = []
+    for index, group in enumerate(groups):
+        # Segments from run_start up to the current one make up the next ShellOp
+        run_start: Optional[int] = None
+        
+        def flush(run_end: int, background: bool = False) -> None:
+            if run_start is None:
+                return
+            text = command[group[run_start][1]:group[run_end - 1][2]].strip()
+            if text:
+                ops.append(ShellOp(text, group[run_start][0] == "&&", background))
+        
+        for position, (separator, start, end) in enumerate(group):
+            segment = command[start:end].strip()
+            path = _cd_target(segment) if segment else None
+            if path is not None:
+                flush(position)
+                run_start = None
+                ops.append(ChdirOp(path, separator == "&&"))
+            elif run_start is None:
+                if segment:
+                    run_start = position
+            elif separator == ";" and group[run_start][0] == "&&":
+                # A conditional run ends at the first ;, after which commands run regardless
+                flush(position)
+                run_start = position
+        flush(len(group), index < len(groups) - 1)
+    return tuple(ops)
+
+
+def _group_concurrent(ops: Tuple[ChainOp, ...]) -> Iterator[Union[ChdirOp, List[ShellOp]]]:
+    """Group a chain into steps to run one after another.
+    
+    Shell commands joined by a bare & share a step and run concurrently;
+    cd commands are always a step of their own.
+    """
+    batch: List[ShellOp] = []
+    for op in ops:
+        if isinstance(op, ChdirOp):
+            if batch:
+                yield batch
+                batch = []
+            yield op
+            continue
+        batch.append(op)
+        if not op.background:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# Only the last lines of a command's stdout and stderr are kept: at most
+# MAX_OUTPUT_LINES of them, holding at most MAX_OUTPUT_BYTES between them
+MAX_OUTPUT_LINES = 10_000
+MAX_OUTPUT_BYTES = 1024 * 1024
+MAX_LINE_LENGTH = 64 * 1024
+READ_CHUNK_SIZE = 64 * 1024
+
+async def _read_pipe(pipe: IO[bytes]) -> bytes:
+    """Read a subprocess pipe to EOF through the event loop.
+    
+    Output is split into lines as it arrives and only the last lines are kept,
+    up to MAX_OUTPUT_LINES lines and MAX_OUTPUT_BYTES bytes, so memory stays
+    flat for commands that print a lot. Lines are cut off after at most
+    MAX_LINE_LENGTH bytes, on a UTF-8 character boundary.
+    
+    Returns:
+        bytes: The retained output, preceded by a note if earlier lines were dropped.
+    """
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    transport, _ = await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), pipe)
+    lines: Deque[bytes] = deque()
+    total = 0
+    retained = 0
+    
+    def keep(line: bytes) -> None:
+        """Retain a line, dropping the oldest ones once over either limit."""
+        nonlocal total, retained
+        lines.append(line)
+        total += 1
+        retained += len(line)
+        while len(lines) > MAX_OUTPUT_LINES or retained > MAX_OUTPUT_BYTES:
+            retained -= len(lines.popleft())
+    
+    # The line being read, and whether it has already hit MAX_LINE_LENGTH
+    pending = bytearray()
+    overlong = False
+    try:
+        while True:
+            chunk = await reader.read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            start = 0
+            while True:
+                end = chunk.find(b"\n", start)
+                if not overlong:
+                    pending += chunk[start:] if end < 0 else chunk[start:end + 1]
+                    if len(pending) > MAX_LINE_LENGTH:
+                        # Back up to the start of a character split by the cut
+                        cut = MAX_LINE_LENGTH
+                        while cut and pending[cut] & 0xC0 == 0x80:
+                            cut -= 1
+                        del pending[cut:]
+                        pending += b"... [line truncated]\n"
+                        overlong = True
+                if end < 0:
+                    break
+                keep(bytes(pending))
+                pending.clear()
+                overlong = False
+                start = end + 1
+    finally:
+        transport.close()
+    if pending:
+        keep(bytes(pending[:-1] if overlong else pending))
+    
+    output = b"".join(lines)
+    if total > len(lines):
+        output = f"[{total - len(lines)} earlier lines omitted]\n".encode() + output
+    return output
+
+
+async def _run_command(cmd: str, cwd: str) -> Tuple[bytes, bytes, int]:
+    """Run a command and collect its stdout and stderr.
+    
+    Popen runs in the default executor: starting a process forks, execs and
+    then blocks reading the exec error pipe, which would otherwise stall the
+    event loop for every command.
+    
+    Args:
+        cmd: The command to run
+        cwd: Directory to run it in
+        
+    Returns:
+        Tuple[bytes, bytes, int]: The command's stdout, stderr and exit status.
+    """
+    loop = asyncio.get_running_loop()
+    # Skip the shell when it is not needed
+    argv = _direct_argv(cmd)
+    process = await loop.run_in_executor(None, functools.partial(
+        subprocess.Popen,
+        argv if argv is not None else cmd,
+        shell=argv is None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=cwd
+    ))
+    stdout, stderr = await asyncio.gather(_read_pipe(process.stdout), _read_pipe(process.stderr))
+    returncode = await loop.run_in_executor(None, process.wait)
+    return stdout, stderr, returncode
+
+
 class TerminalTool(BaseTool):
     """Tool for executing terminal commands."""
     
@@ -41,15 +341,20 @@ class TerminalTool(BaseTool):
             try:
                 logger.info(f"Executing command: {command}")
                 
-                # Split the command by & to handle multiple commands
-                commands = [cmd.strip() for cmd in command.split("&") if cmd.strip()]
                 final_output = ""
                 final_error = ""
+                succeeded = True
                 
-                for cmd in commands:
+                for step in _group_concurrent(_parse_command_chain(command)):
+                    # Commands after && are skipped once the chain has failed
+                    first = step if isinstance(step, ChdirOp) else step[0]
+                    if first.conditional and not succeeded:
+                        continue
+                    
                     # Handle cd command specially to maintain state
-                    if cmd.startswith("cd "):
-                        path = cmd[3:].strip()
+                    if isinstance(step, ChdirOp):
+                        succeeded = False
+                        path = os.path.expanduser(step.path)
                         try:
                             # Handle relative paths
                             if not os.path.isabs(path):
@@ -63,27 +368,30 @@ class TerminalTool(BaseTool):
                                 final_error += f"Directory not found: {path}\n"
                                 continue
                                 
+                            # A cd to the current directory needs no chdir
+                            if path == self.current_path:
+                                final_output += f"Already in {path}\n"
+                                succeeded = True
+                                continue
+                            
                             # Change the current directory
                             os.chdir(path)
                             self.current_path = path
                             final_output += f"Changed directory to {path}\n"
+                            succeeded = True
                         except Exception as e:
                             final_error += f"Error changing directory: {str(e)}\n"
                     else:
-                        # Execute the command
-                        process = await asyncio.create_subprocess_shell(
-                            cmd,
-                            stdout=asyncio.subprocess.PIPE,
-                            stderr=asyncio.subprocess.PIPE,
-                            cwd=self.current_path
-                        )
-                        
-                        stdout, stderr = await process.communicate()
-                        
-                        if stdout:
-                            final_output += stdout.decode() + "\n"
-                        if stderr:
-                            final_error += stderr.decode() + "\n"
+                        # Execute the commands, concurrently if joined by &; output keeps chain order
+                        results = await asyncio.gather(*(
+                            _run_command(op.command, self.current_path) for op in step
+                        ))
+                        for stdout, stderr, returncode in results:
+                            if stdout:
+                                final_output += stdout.decode(errors="replace") + "\n"
+                            if stderr:
+                                final_error += stderr.decode(errors="replace") + "\n"
+                        succeeded = returncode == 0
                 
                 return ToolResult(
                     success=True,
@@ -100,15 +408,13 @@ class TerminalTool(BaseTool):
                     output=f"Error executing command: {str(e)}"
                 )
     
-    def get_parameters_schema(self) -> Dict[str, Any]:
-        """Get the parameters schema for this tool."""
-        return {
-            "type": "object",
-            "properties": {
-                "command": {
-                    "type": "string",
-                    "description": "The terminal command to execute."
-                }
-            },
-            "required": ["command"]
-        }
\ No newline at end of file
+    PARAMETERS_SCHEMA: ClassVar[Dict[str, Any]] = {
+        "type": "object",
+        "properties": {
+            "command": {
+                "type": "string",
+                "description": "The terminal command to execute."
+            }
+        },
+        "required": ["command"]
+    }
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, ClassVar
 
 from uranus.tool.tool_registry import BaseTool, ToolResult
 
@@ -27,16 +27,14 @@ class TerminateTool(BaseTool):
             output=f"The interaction has been completed with status: {status}"
         )
     
-    def get_parameters_schema(self) -> Dict[str, Any]:
-        """Get the parameters schema for this tool."""
-        return {
-            "type": "object",
-            "properties": {
-                "status": {
-                    "type": "string",
-                    "description": "The finish status of the interaction.",
-                    "enum": ["success", "failure"]
-                }
-            },
-            "required": ["status"]
-        }
\ No newline at end of file
+    PARAMETERS_SCHEMA: ClassVar[Dict[str, Any]] = {
+        "type": "object",
+        "properties": {
+            "status": {
+                "type": "string",
+                "description": "The finish status of the interaction.",
+                "enum": ["success", "failure"]
+            }
+        },
+        "required": ["status"]
+    }
\ No newline at end of file
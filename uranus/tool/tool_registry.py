@@ -1,11 +1,43 @@
-from typing import Dict, List, Optional, Any, Callable, Type
-from pydantic import BaseModel, Field
+import copy
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Any, Callable, ClassVar, Type
+from pydantic import BaseModel, Field, PrivateAttr
 
-class ToolResult(BaseModel):
-    """Result of a tool execution."""
+@dataclass(slots=True)
+class ToolResult:
+    """Result of a tool execution.
+    
+    A slotted dataclass rather than a pydantic model: one is built for every
+    tool call, always from values the tool itself produced.
+    """
     success: bool = True
     output: str = ""
     data: Optional[Dict[str, Any]] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the result fields as a dictionary."""
+        return {
+            "success": self.success,
+            "output": self.output,
+            "data": self.data
+        }
+    
+    def model_dump(self) -> Dict[str, Any]:
+        """Get the result fields as a dictionary.
+        
+        Kept for compatibility with code written against the former pydantic model.
+        """
+        return self.to_dict()
+    
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "ToolResult":
+        """Copy the result, optionally replacing some fields.
+        
+        Kept for compatibility with code written against the former pydantic model.
+        """
+        copied = replace(self, **(update or {}))
+        if deep:
+            copied.data = copy.deepcopy(copied.data)
+        return copied
 
 class ToolError(Exception):
     """Error raised by tools."""
@@ -16,6 +48,14 @@ class BaseTool(BaseModel):
     name: str
     description: str
     
+    # JSON schema of execute's parameters. Subclasses override it with a
+    # constant, so it is built once per class and shared; do not modify it.
+    PARAMETERS_SCHEMA: ClassVar[Dict[str, Any]] = {
+        "type": "object",
+        "properties": {},
+        "required": []
+    }
+    
     async def execute(self, **kwargs) -> ToolResult:
         """Execute the tool with the given parameters."""
         raise NotImplementedError("Tool must implement execute method")
@@ -33,26 +73,36 @@ class BaseTool(BaseModel):
     
     def get_parameters_schema(self) -> Dict[str, Any]:
         """Get the parameters schema for this tool."""
-        return {
-            "type": "object",
-            "properties": {},
-            "required": []
-        }
+        return self.PARAMETERS_SCHEMA
 
 class ToolRegistry(BaseModel):
     """Registry of available tools."""
     tools: Dict[str, BaseTool] = Field(default_factory=dict)
     
+    # Bumped on every registration so callers can cache derived values
+    _version: int = PrivateAttr(default=0)
+    _params_cache: Optional[List[Dict[str, Any]]] = PrivateAttr(default=None)
+    _desc_cache: Optional[str] = PrivateAttr(default=None)
+    
+    @property
+    def version(self) -> int:
+        """Get the registry version, incremented whenever a tool is registered."""
+        return self._version
+    
     def register(self, tool: BaseTool) -> None:
         """Register a tool."""
         self.tools[tool.name] = tool
+        self._version += 1
+        self._params_cache = None
+        self._desc_cache = None
     
     def get_tools_description(self) -> str:
         """Get a formatted description of all registered tools."""
-        descriptions = []
-        for tool_name, tool in self.tools.items():
-            descriptions.append(f"- {tool.name}: {tool.description}")
-        return "\n".join(descriptions)
+        if self._desc_cache is None:
+            self._desc_cache = "\n".join(
+                f"- {tool.name}: {tool.description}" for tool in self.tools.values()
+            )
+        return self._desc_cache
     
     def get(self, tool_name: str) -> Optional[BaseTool]:
         """Get a tool by name."""
@@ -64,7 +114,16 @@ class ToolRegistry(BaseModel):
     
     def to_params(self) -> List[Dict[str, Any]]:
         """Convert all tools to parameters for LLM API."""
-        return [tool.to_param() for tool in self.tools.values()]
+        if self._params_cache is None:
+            self._params_cache = [tool.to_param() for tool in self.tools.values()]
+        return self._params_cache
+    
+    async def aclose(self) -> None:
+        """Release resources held by tools that define an aclose() method."""
+        for tool in self.tools.values():
+            aclose = getattr(tool, "aclose", None)
+            if aclose is not None:
+                await aclose()
     
     async def execute(self, name: str, **kwargs) -> ToolResult:
         """Execute a tool by name."""
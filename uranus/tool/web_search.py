@@ -1,16 +1,61 @@
+import asyncio
 import json
-from typing import Dict, Any, Optional, List
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, ClassVar, Tuple
 import aiohttp
 
+from pydantic import PrivateAttr
+
 from uranus.tool.tool_registry import BaseTool, ToolResult, ToolError
 
 
+# Maximum number of searches kept by each tool's result cache, and how long they stay valid in seconds
+SEARCH_CACHE_SIZE = 256
+SEARCH_CACHE_TTL = 600.0
+
+# Session shared by all WebSearchTool instances, and the event loop it belongs to
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_session() -> aiohttp.ClientSession:
+    """Get the shared, connection-pooled HTTP session for search requests.
+    
+    Connections to the search API are kept alive between queries, so repeat
+    searches skip the TCP and TLS handshakes. A new session is created if the
+    previous one was closed or belongs to another event loop.
+    
+    Returns:
+        aiohttp.ClientSession: The shared session.
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+        )
+        _session_loop = loop
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared search session, if one is open."""
+    global _session, _session_loop
+    session, _session, _session_loop = _session, None, None
+    if session is not None and not session.closed:
+        await session.close()
+
+
 class WebSearchTool(BaseTool):
     """Tool for searching the web."""
     
     name: str = "web_search"
     description: str = "Search the web for information on a given query."
     
+    # Recent results keyed by (normalized query, num_results), as (monotonic timestamp, result)
+    _cache: "OrderedDict[Tuple[str, Optional[int]], Tuple[float, ToolResult]]" = PrivateAttr(default_factory=OrderedDict)
+    
     async def execute(
         self, 
         query: str,
@@ -29,23 +74,32 @@ class WebSearchTool(BaseTool):
         if not query:
             raise ToolError("Query parameter is required")
             
+        # Repeat searches within the TTL are answered from the cache
+        cache_key = (query.strip().lower(), num_results)
+        now = time.monotonic()
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            if now - cached[0] < SEARCH_CACHE_TTL:
+                self._cache.move_to_end(cache_key)
+                return cached[1].model_copy(deep=True)
+            del self._cache[cache_key]
+            
         try:
             # Using SerpAPI-like service (you'll need to replace with your actual API)
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "q": query,
-                    "num": num_results,
-                    "api_key": "your-serpapi-key-here"  # Replace with env var or config
-                }
-                
-                async with session.get(
-                    "https://serpapi.com/search", 
-                    params=params
-                ) as response:
-                    if response.status != 200:
-                        raise ToolError(f"Search API returned status code {response.status}")
-                        
-                    data = await response.json()
+            params = {
+                "q": query,
+                "num": num_results,
+                "api_key": "your-serpapi-key-here"  # Replace with env var or config
+            }
+            
+            async with get_session().get(
+                "https://serpapi.com/search", 
+                params=params
+            ) as response:
+                if response.status != 200:
+                    raise ToolError(f"Search API returned status code {response.status}")
+                    
+                data = await response.json()
                     
             # Process results
             organic_results = data.get("organic_results", [])
@@ -65,33 +119,39 @@ class WebSearchTool(BaseTool):
                 output += f"   {result['link']}\n"
                 output += f"   {result['snippet']}\n\n"
                 
-            return ToolResult(
+            tool_result = ToolResult(
                 success=True,
                 output=output,
                 data={"query": query, "results": formatted_results}
             )
+            self._cache[cache_key] = (now, tool_result.model_copy(deep=True))
+            if len(self._cache) > SEARCH_CACHE_SIZE:
+                self._cache.popitem(last=False)
+            return tool_result
             
         except ToolError as e:
             raise e
         except Exception as e:
             raise ToolError(f"Error during web search: {str(e)}")
     
-    def get_parameters_schema(self) -> Dict[str, Any]:
-        """Get the parameters schema for this tool."""
-        return {
-            "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "The search query"
-                },
-                "num_results": {
-                    "type": "integer",
-                    "description": "Number of results to return",
-                    "default": 5,
-                    "minimum": 1,
-                    "maximum": 10
-                }
+    async def aclose(self) -> None:
+        """Close the shared search session."""
+        await close_session()
+    
+    PARAMETERS_SCHEMA: ClassVar[Dict[str, Any]] = {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "The search query"
             },
-            "required": ["query"]
-        }
\ No newline at end of file
+            "num_results": {
+                "type": "integer",
+                "description": "Number of results to return",
+                "default": 5,
+                "minimum": 1,
+                "maximum": 10
+            }
+        },
+        "required": ["query"]
+    }
\ No newline at end of file
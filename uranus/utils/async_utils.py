@@ -0,0 +1,101 @@
+"""Asyncio helpers for Uranus."""
+import asyncio
+import inspect
+import threading
+from typing import Any, Coroutine, TypeVar
+
+
+T = TypeVar("T")
+
+
+def install_event_loop_policy() -> bool:
+    """
+    Install uvloop's event loop policy if uvloop is available.
+    
+    Falls back to the stdlib policy when uvloop is not installed or cannot
+    be used on this interpreter (e.g. free-threaded builds).
+    
+    Returns:
+        True if uvloop was installed, False otherwise
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+        
+    try:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return True
+    except (AttributeError, RuntimeError):
+        asyncio.set_event_loop_policy(asyncio.DefaultEventLoopPolicy())
+        return False
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion, using uvloop when available.
+    
+    Args:
+        coro: The coroutine to run
+    
+    Returns:
+        The coroutine's result
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    
+    if not hasattr(uvloop, "run"):
+        install_event_loop_policy()
+        return asyncio.run(coro)
+    
+    try:
+        return uvloop.run(coro)
+    except RuntimeError:
+        # uvloop could not start a loop on this interpreter; fall back to the
+        # stdlib loop, but only if the coroutine itself never got to run
+        if inspect.getcoroutinestate(coro) != inspect.CORO_CREATED:
+            raise
+        asyncio.set_event_loop_policy(asyncio.DefaultEventLoopPolicy())
+        return asyncio.run(coro)
+
+
+async def ainput(prompt: str = "") -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+    
+    The blocking input() call runs on a daemon thread, so an interrupted
+    prompt never keeps the interpreter or the loop's executor from shutting down.
+    
+    Args:
+        prompt: The prompt to print before reading
+    
+    Returns:
+        The line read, without the trailing newline
+    
+    Raises:
+        EOFError: If stdin is closed
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def resolve(method, value) -> None:
+        if not future.done():
+            method(value)
+    
+    def read() -> None:
+        try:
+            line = input(prompt)
+        except BaseException as e:
+            callback = (resolve, future.set_exception, e)
+        else:
+            callback = (resolve, future.set_result, line)
+        try:
+            loop.call_soon_threadsafe(*callback)
+        except RuntimeError:
+            # The loop was closed while waiting for input
+            pass
+    
+    threading.Thread(target=read, name="uranus-ainput", daemon=True).start()
+    return await future
\ No newline at end of file
@@ -1,8 +1,10 @@
 """System utilities for Uranus."""
 import os
 import platform
+import shutil
 import subprocess
-from typing import Dict, Any, List, Optional, Tuple, Union
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple, Union
 
 
 def get_system_info() -> Dict[str, Any]:
@@ -72,26 +74,22 @@ def is_command_available(command: str) -> bool:
     Returns:
         True if the command is available, False otherwise
     """
-    try:
-        subprocess.run(
-            ["which", command] if platform.system() != "Windows" else ["where", command],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            check=False
-        )
-        return True
-    except (subprocess.SubprocessError, FileNotFoundError):
-        return False
+    return shutil.which(command) is not None
 
 
-def get_environment_variables() -> Dict[str, str]:
+def get_environment_variables(snapshot: bool = False) -> Mapping[str, str]:
     """
     Get all environment variables.
     
+    Args:
+        snapshot: Return a copy that can be modified, instead of a live read-only view
+        
     Returns:
-        Dictionary of environment variables
+        Read-only view of the environment variables, or a dictionary copy if snapshot is set
     """
-    return dict(os.environ)
+    if snapshot:
+        return dict(os.environ)
+    return MappingProxyType(os.environ)
 
 
 def get_memory_usage() -> Dict[str, Any]:
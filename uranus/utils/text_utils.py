@@ -1,6 +1,45 @@
 """Text processing utilities for Uranus."""
+import json
 import re
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Patterns compiled once at import
+_CODE_BLOCK_RE = re.compile(r"```(\w*)\n([\s\S]*?)```")
+# Characters that matter when scanning for a JSON object; escape pairs are one token
+_JSON_TOKEN_RE = re.compile(r'\\.|[{}"]', re.DOTALL)
+# Digit runs this long may be integers wider than 64 bits, which orjson turns into floats
+_LONG_DIGITS_RE = re.compile(r"\d{19}")
+
+
+def _json_loads(text: str) -> Any:
+    """
+    Parse JSON with the same result as json.loads, using orjson when it is installed.
+    
+    orjson rejects NaN, Infinity and out-of-range numbers that json.loads
+    accepts, and loses precision on integers wider than 64 bits, so anything
+    it fails on, and any text with a long run of digits, goes to json.loads.
+    
+    Args:
+        text: JSON text to parse
+        
+    Returns:
+        The parsed value
+    
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON
+    """
+    if orjson is not None and not _LONG_DIGITS_RE.search(text):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
 
 
 def extract_code_blocks(text: str) -> List[Dict[str, str]]:
@@ -13,8 +52,7 @@ def extract_code_blocks(text: str) -> List[Dict[str, str]]:
     Returns:
         List of dictionaries with 'language' and 'code' keys
     """
-    pattern = r"```(\w*)\n([\s\S]*?)```"
-    matches = re.finditer(pattern, text)
+    matches = _CODE_BLOCK_RE.finditer(text)
     
     code_blocks = []
     for match in matches:
@@ -28,6 +66,42 @@ def extract_code_blocks(text: str) -> List[Dict[str, str]]:
     return code_blocks
 
 
+def _find_balanced_json(text: str) -> Iterator[str]:
+    """
+    Yield each top-level brace-balanced span of text, in order.
+    
+    Braces inside JSON string literals are ignored. The text is scanned once,
+    jumping between braces, quotes and escapes rather than visiting every character.
+    
+    Args:
+        text: Text that may contain JSON objects
+        
+    Yields:
+        Candidate JSON object strings
+    """
+    depth = 0
+    start = 0
+    in_string = False
+    for match in _JSON_TOKEN_RE.finditer(text):
+        token = match.group()
+        if in_string:
+            if token == '"':
+                in_string = False
+        elif token == "{":
+            if depth == 0:
+                start = match.start()
+            depth += 1
+        elif depth == 0:
+            # Quotes and stray braces outside an object are just prose
+            continue
+        elif token == "}":
+            depth -= 1
+            if depth == 0:
+                yield text[start:match.end()]
+        elif token == '"':
+            in_string = True
+
+
 def extract_json_block(text: str) -> Optional[Dict[str, Any]]:
     """
     Extract and parse a JSON block from text.
@@ -38,26 +112,21 @@ def extract_json_block(text: str) -> Optional[Dict[str, Any]]:
     Returns:
         Parsed JSON as a dictionary, or None if no valid JSON found
     """
-    import json
-    
     # Try to find JSON between triple backticks
     code_blocks = extract_code_blocks(text)
     for block in code_blocks:
         if block["language"].lower() in ["json", ""]:
             try:
-                return json.loads(block["code"])
+                return _json_loads(block["code"])
             except json.JSONDecodeError:
                 continue
     
-    # Try to find JSON between curly braces
-    try:
-        pattern = r"\{[\s\S]*\}"
-        match = re.search(pattern, text)
-        if match:
-            json_str = match.group(0)
-            return json.loads(json_str)
-    except (json.JSONDecodeError, AttributeError):
-        pass
+    # Try each balanced {...} span in the text
+    for candidate in _find_balanced_json(text):
+        try:
+            return _json_loads(candidate)
+        except json.JSONDecodeError:
+            continue
     
     return None
 
@@ -1,6 +1,46 @@
 """Date and time utilities for Uranus."""
 import datetime
-from typing import Optional, Union
+import re
+from bisect import bisect_right
+from time import time as _time
+from typing import List, Optional, Tuple, Union
+
+
+# Formats tried by parse_datetime when none are given, in order
+DEFAULT_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+    "%d/%m/%Y %H:%M:%S",
+    "%d/%m/%Y",
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y",
+    "%b %d, %Y",
+    "%B %d, %Y",
+    "%d %b %Y",
+    "%d %B %Y"
+)
+
+# The default formats grouped by how a matching string starts. The groups are
+# disjoint, so a string whose start matches one group cannot parse with any
+# format outside it.
+_FORMAT_FAMILIES: List[Tuple["re.Pattern[str]", Tuple[str, ...]]] = [
+    (re.compile(r"\d{4}-"), DEFAULT_FORMATS[0:2]),
+    (re.compile(r"\d{1,2}/"), DEFAULT_FORMATS[2:6]),
+    (re.compile(r"[A-Za-z]"), DEFAULT_FORMATS[6:8]),
+    (re.compile(r"\d{1,2}\s"), DEFAULT_FORMATS[8:10]),
+]
+
+# time_ago units: a difference below _TIME_AGO_THRESHOLDS[i] seconds uses _TIME_AGO_UNITS[i]
+_TIME_AGO_THRESHOLDS = (60, 3600, 86400, 604800, 2592000, 31536000)
+_TIME_AGO_UNITS = (
+    (1, "seconds"),
+    (60, "minutes"),
+    (3600, "hours"),
+    (86400, "days"),
+    (604800, "weeks"),
+    (2592000, "months"),
+    (31536000, "years"),
+)
 
 
 def get_current_timestamp() -> float:
@@ -10,7 +50,7 @@ def get_current_timestamp() -> float:
     Returns:
         Current timestamp
     """
-    return datetime.datetime.now().timestamp()
+    return _time()
 
 
 def format_timestamp(
@@ -50,22 +90,17 @@ def parse_datetime(
         Parsed datetime object, or None if parsing failed
     """
     if formats is None:
-        formats = [
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d",
-            "%d/%m/%Y %H:%M:%S",
-            "%d/%m/%Y",
-            "%m/%d/%Y %H:%M:%S",
-            "%m/%d/%Y",
-            "%b %d, %Y",
-            "%B %d, %Y",
-            "%d %b %Y",
-            "%d %B %Y"
-        ]
+        # Only try the default formats that could match how the string starts
+        formats = DEFAULT_FORMATS
+        for pattern, family in _FORMAT_FAMILIES:
+            if pattern.match(date_str):
+                formats = family
+                break
     
+    strptime = datetime.datetime.strptime
     for fmt in formats:
         try:
-            return datetime.datetime.strptime(date_str, fmt)
+            return strptime(date_str, fmt)
         except ValueError:
             continue
     
@@ -82,23 +117,6 @@ def time_ago(timestamp: float) -> str:
     Returns:
         Human-readable time difference
     """
-    now = datetime.datetime.now()
-    dt = datetime.datetime.fromtimestamp(timestamp)
-    diff = now - dt
-    
-    seconds = diff.total_seconds()
-    
-    if seconds < 60:
-        return f"{int(seconds)} seconds ago"
-    elif seconds < 3600:
-        return f"{int(seconds / 60)} minutes ago"
-    elif seconds < 86400:
-        return f"{int(seconds / 3600)} hours ago"
-    elif seconds < 604800:
-        return f"{int(seconds / 86400)} days ago"
-    elif seconds < 2592000:
-        return f"{int(seconds / 604800)} weeks ago"
-    elif seconds < 31536000:
-        return f"{int(seconds / 2592000)} months ago"
-    else:
-        return f"{int(seconds / 31536000)} years ago"
\ No newline at end of file
+    seconds = _time() - timestamp
+    divisor, unit = _TIME_AGO_UNITS[bisect_right(_TIME_AGO_THRESHOLDS, seconds)]
+    return f"{int(seconds / divisor)} {unit} ago"
\ No newline at end of file
@@ -1,6 +1,23 @@
 """Validation utilities for Uranus."""
+import json
 import re
-from typing import Any, Dict, List, Optional, Union, Callable
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union, Callable
+
+from uranus.utils.text_utils import _json_loads
+
+
+# Patterns compiled once at import
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_URL_RE = re.compile(r"^(https?|ftp)://[^\s/$.?#].[^\s]*$")
+_URL_SCHEMES = ("http://", "https://", "ftp://")
+
+
+class CompiledSchema(NamedTuple):
+    """A validate_dict schema prepared by compile_schema."""
+    # Names of the required fields
+    required: Tuple[str, ...]
+    # Field name -> (type, validator)
+    rules: Dict[str, Tuple[Any, Optional[Callable]]]
 
 
 def is_valid_email(email: str) -> bool:
@@ -13,8 +30,10 @@ def is_valid_email(email: str) -> bool:
     Returns:
         True if the email is valid, False otherwise
     """
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, email))
+    # Cheap structural checks reject most invalid input before the regex runs
+    if email.count("@") != 1 or "." not in email.rpartition("@")[2]:
+        return False
+    return bool(_EMAIL_RE.match(email))
 
 
 def is_valid_url(url: str) -> bool:
@@ -27,17 +46,47 @@ def is_valid_url(url: str) -> bool:
     Returns:
         True if the URL is valid, False otherwise
     """
-    pattern = r"^(https?|ftp)://[^\s/$.?#].[^\s]*$"
-    return bool(re.match(pattern, url))
+    # Cheap scheme check rejects most invalid input before the regex runs
+    if not url.startswith(_URL_SCHEMES):
+        return False
+    return bool(_URL_RE.match(url))
+
+
+def compile_schema(schema: Dict[str, Dict[str, Any]]) -> CompiledSchema:
+    """
+    Prepare a validate_dict schema for repeated use.
+    
+    The result is a snapshot: later changes to the schema do not affect it.
+    
+    Args:
+        schema: Schema to compile, in the format validate_dict accepts
+        
+    Returns:
+        The compiled schema, to pass to validate_dict in place of the dict
+    """
+    required = []
+    rules = {}
+    for name, field_schema in schema.items():
+        if field_schema.get("required", False):
+            required.append(name)
+        validator = field_schema.get("validator")
+        rules[name] = (
+            field_schema.get("type") or None,
+            validator if validator and callable(validator) else None
+        )
+    return CompiledSchema(tuple(required), rules)
 
 
 def validate_dict(
     data: Dict[str, Any],
-    schema: Dict[str, Dict[str, Any]]
+    schema: Union[Dict[str, Dict[str, Any]], CompiledSchema]
 ) -> List[str]:
     """
     Validate a dictionary against a schema.
     
+    A schema used for many dictionaries can be compiled once with
+    compile_schema and passed in compiled.
+    
     Args:
         data: Dictionary to validate
         schema: Schema to validate against
@@ -48,10 +97,14 @@ def validate_dict(
                     "validator": callable (optional)
                 }
             }
+            or the result of compile_schema for such a schema
             
     Returns:
         List of validation errors, empty if valid
     """
+    if isinstance(schema, CompiledSchema):
+        return _validate_compiled(data, schema)
+    
     errors = []
     
     # Check required fields
@@ -84,6 +137,49 @@ def validate_dict(
     return errors
 
 
+def _validate_compiled(data: Dict[str, Any], schema: CompiledSchema) -> List[str]:
+    """
+    Validate a dictionary against a compiled schema; see validate_dict.
+    
+    Args:
+        data: Dictionary to validate
+        schema: Compiled schema to validate against
+        
+    Returns:
+        List of validation errors, empty if valid
+    """
+    errors = []
+    required, rules = schema
+    
+    # Check required fields
+    for field_name in required:
+        if field_name not in data:
+            errors.append(f"Missing required field: {field_name}")
+    
+    # Validate fields
+    for field_name, value in data.items():
+        rule = rules.get(field_name)
+        if rule is None:
+            continue
+            
+        expected_type, validator = rule
+        
+        # Validate type
+        if expected_type and not isinstance(value, expected_type):
+            errors.append(f"Field {field_name} has invalid type: expected {expected_type}, got {type(value)}")
+        
+        # Run custom validator
+        if validator is not None:
+            try:
+                result = validator(value)
+                if result is not True and result is not None:
+                    errors.append(f"Field {field_name} failed validation: {result}")
+            except Exception as e:
+                errors.append(f"Field {field_name} validation error: {str(e)}")
+    
+    return errors
+
+
 def is_valid_json_string(json_str: str) -> bool:
     """
     Check if a string is valid JSON.
@@ -94,10 +190,8 @@ def is_valid_json_string(json_str: str) -> bool:
     Returns:
         True if the string is valid JSON, False otherwise
     """
-    import json
-    
     try:
-        json.loads(json_str)
+        _json_loads(json_str)
         return True
     except json.JSONDecodeError:
         return False
\ No newline at end of file